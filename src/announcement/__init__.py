@@ -1,3 +1,3 @@
-from .announcement_client import AnnouncementClient
+from .announcement_client import AnnouncementClient, ShardedAnnouncementClient
 
-__all__ = ["AnnouncementClient"]
+__all__ = ["AnnouncementClient", "ShardedAnnouncementClient"]
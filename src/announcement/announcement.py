@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any
 
 import discord
@@ -12,14 +13,14 @@ class Announcement:
         self._server = server
         self._event = event
 
-    @property
+    @cached_property
     def embed(self) -> discord.Embed:
         result = discord.Embed(
-            title=self._server.language.config.embed.reminder, colour=self.EMBED_COLOUR
+            title=self._server.render_context.reminder_title, colour=self.EMBED_COLOUR
         )
 
         result.add_field(
-            name=self._event.get_embed_name(self._server.timezones),
+            name=self.name,
             value=self._event.get_embed_value(self._server.timezones),
             inline=False,
         )
@@ -30,12 +31,12 @@ class Announcement:
     def channel_id(self) -> int:
         return self._server.announcement_channel_id
 
-    @property
-    def name(self) -> str | None:
-        return self.embed.fields[0].name
+    @cached_property
+    def name(self) -> str:
+        return self._event.get_embed_name(self._server.timezones)
 
-    @property
-    def comparison_key(self) -> tuple[int, str | None]:
+    @cached_property
+    def comparison_key(self) -> tuple[int, str]:
         return (self.channel_id, self.name)
 
     def __eq__(self, other: Any) -> bool:
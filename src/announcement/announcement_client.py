@@ -1,45 +1,177 @@
+import asyncio
 import logging
+import os
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import aiocron
 import discord
 
 from announcement.announcement import Announcement
-from server import Server
+from announcement.announcement_ledger import AnnouncementLedger
+from announcement.announcement_queue import AnnouncementQueue
+from client import ServerClient
+from server import BaseEvent, Server
 
 logger = logging.getLogger(__name__)
 
 
-class AnnouncementClient(discord.Client):
+class AnnouncementClient(ServerClient):
+    SCHEDULER_MODE = os.environ.get("QUANTUM_BOT_ANNOUNCEMENT_SCHEDULER") or "cron"
+    MAX_CONCURRENT_SENDS = 10
+    ANNOUNCEMENT_LEDGER_PATH = os.environ.get("QUANTUM_BOT_ANNOUNCEMENT_LEDGER") or None
+    ANNOUNCEMENT_GRACE_PERIOD = timedelta(
+        minutes=int(os.environ.get("QUANTUM_BOT_ANNOUNCEMENT_GRACE_MINUTES") or "5")
+    )
+
     async def on_ready(self) -> None:
         logger.info("Logged in as %s", self.user)
 
-        self.servers = Server.from_directory()
-        self._announcement_cron = aiocron.crontab("* * * * *", self.send_announcements)
+        self._ensure_set_up()
+
+    def _set_up(self) -> None:
+        super()._set_up()
+        self._start_announcement_scheduler()
+
+    def _start_announcement_scheduler(self) -> None:
+        self._announcement_ledger = AnnouncementLedger(
+            Path(self.ANNOUNCEMENT_LEDGER_PATH)
+            if self.ANNOUNCEMENT_LEDGER_PATH is not None
+            else None
+        )
+
+        start_datetime = self._get_current_datetime()
+        if self._announcement_ledger.is_persistent:
+            start_datetime -= self.ANNOUNCEMENT_GRACE_PERIOD
+
+        self._announcement_queue = AnnouncementQueue(self.servers, start_datetime)
+        self._scheduler_rearmed = asyncio.Event()
+
+        match self.SCHEDULER_MODE:
+            case "sleep":
+                self._announcement_task = asyncio.create_task(
+                    self._run_announcement_scheduler()
+                )
+            case _:
+                self._announcement_cron = aiocron.crontab(
+                    "* * * * *", self.send_announcements
+                )
+
+    @staticmethod
+    def _get_current_datetime() -> datetime:
+        return datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
+    def _get_seconds_until_next_announcement(self) -> float | None:
+        if (next_fire_time := self._announcement_queue.next_fire_time) is None:
+            return None
 
-    def _get_announcements_to_send(self) -> set[Announcement]:
-        current_datetime = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        return max((next_fire_time - datetime.now(timezone.utc)).total_seconds(), 0)
+
+    def _on_servers_reloaded(
+        self, updated_servers: dict[int, Server], removed_server_ids: set[int]
+    ) -> None:
+        super()._on_servers_reloaded(updated_servers, removed_server_ids)
+
+        current_datetime = self._get_current_datetime()
+
+        for server_id in removed_server_ids:
+            self._announcement_queue.remove_server(server_id)
+
+        for server in updated_servers.values():
+            self._announcement_queue.update_server(server, current_datetime)
+
+        self.rearm_scheduler()
+
+    def rearm_scheduler(self) -> None:
+        self._scheduler_rearmed.set()
+
+    async def _run_announcement_scheduler(self) -> None:
+        while True:
+            self._scheduler_rearmed.clear()
+
+            try:
+                await asyncio.wait_for(
+                    self._scheduler_rearmed.wait(),
+                    self._get_seconds_until_next_announcement(),
+                )
+                continue
+            except TimeoutError:
+                pass
 
-        return {
-            Announcement(server, event)
-            for server in self.servers.values()
-            for event in server.events
-            for announcement in event.announcements
-            if current_datetime + timedelta(minutes=announcement) == event.start_time
-        }
+            try:
+                await self.send_announcements()
+            except Exception:
+                logger.exception("Unable to send announcements")
+
+    def _get_announcements_to_send(self) -> dict[Announcement, list[int]]:
+        current_datetime = self._get_current_datetime()
+        result: dict[Announcement, list[int]] = defaultdict(list)
+
+        for server, event, fire_minute in self._announcement_queue.pop_due(
+            current_datetime, self.ANNOUNCEMENT_GRACE_PERIOD
+        ):
+            announcement = Announcement(server, event)
+
+            if not self._announcement_ledger.is_sent(
+                announcement.channel_id, announcement.name, fire_minute
+            ):
+                result[announcement].append(fire_minute)
+
+        self._announcement_ledger.prune(
+            BaseEvent.get_epoch_minute(
+                current_datetime - self.ANNOUNCEMENT_GRACE_PERIOD
+            )
+        )
+
+        return dict(result)
+
+    async def _send_channel_announcements(
+        self,
+        channel_id: int,
+        announcements: list[tuple[Announcement, list[int]]],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        if not isinstance(
+            channel := self.get_channel(channel_id), discord.abc.Messageable
+        ):
+            raise ValueError(f"Cannot send messages to channel ID {channel_id}")
+
+        for item, fire_minutes in announcements:
+            async with semaphore:
+                await channel.send("@everyone", embed=item.embed)
+
+            self._announcement_ledger.mark_sent(channel_id, item.name, fire_minutes)
+            logger.info("Sent announcement: %s", item.name)
 
     async def send_announcements(self) -> None:
         announcements = self._get_announcements_to_send()
         logger.info("Announcement count: %s", len(announcements))
 
-        for item in announcements:
-            if not isinstance(
-                channel := self.get_channel(item.channel_id),
-                discord.abc.Messageable,
-            ):
-                raise ValueError(
-                    f"Cannot send messages to channel ID {item.channel_id}"
-                )
+        announcements_by_channel: dict[int, list[tuple[Announcement, list[int]]]] = (
+            defaultdict(list)
+        )
+        for item, fire_minutes in announcements.items():
+            announcements_by_channel[item.channel_id].append((item, fire_minutes))
 
-            await channel.send("@everyone", embed=item.embed)
-            logger.info("Sent announcement: %s", item.name)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        results = await asyncio.gather(
+            *(
+                self._send_channel_announcements(channel_id, items, semaphore)
+                for channel_id, items in announcements_by_channel.items()
+            ),
+            return_exceptions=True,
+        )
+        self._announcement_ledger.commit()
+
+        exceptions = [result for result in results if isinstance(result, Exception)]
+
+        if len(exceptions) == 1:
+            raise exceptions[0]
+
+        if exceptions:
+            raise ExceptionGroup("Error sending announcements", exceptions)
+
+
+class ShardedAnnouncementClient(AnnouncementClient, discord.AutoShardedClient):
+    pass
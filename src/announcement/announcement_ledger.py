@@ -0,0 +1,59 @@
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+
+class AnnouncementLedger:
+    IN_MEMORY_PATH = ":memory:"
+
+    def __init__(self, path: Path | None = None):
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._path = path
+        self._connection = sqlite3.connect(
+            self.IN_MEMORY_PATH if path is None else path
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sent_announcements ("
+            "fire_minute INTEGER NOT NULL, "
+            "channel_id INTEGER NOT NULL, "
+            "name TEXT NOT NULL, "
+            "PRIMARY KEY (fire_minute, channel_id, name)"
+            ") WITHOUT ROWID"
+        )
+        self._connection.commit()
+
+    @property
+    def is_persistent(self) -> bool:
+        return self._path is not None
+
+    def is_sent(self, channel_id: int, name: str, fire_minute: int) -> bool:
+        cursor = self._connection.execute(
+            "SELECT 1 FROM sent_announcements "
+            "WHERE fire_minute = ? AND channel_id = ? AND name = ?",
+            (fire_minute, channel_id, name),
+        )
+
+        return cursor.fetchone() is not None
+
+    def mark_sent(
+        self, channel_id: int, name: str, fire_minutes: Iterable[int]
+    ) -> None:
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO sent_announcements VALUES (?, ?, ?)",
+            ((fire_minute, channel_id, name) for fire_minute in fire_minutes),
+        )
+
+    def prune(self, before_fire_minute: int) -> None:
+        self._connection.execute(
+            "DELETE FROM sent_announcements WHERE fire_minute < ?",
+            (before_fire_minute,),
+        )
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.commit()
+        self._connection.close()
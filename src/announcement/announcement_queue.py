@@ -0,0 +1,81 @@
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import Generator
+
+from server import BaseEvent, Server
+
+
+class AnnouncementQueue:
+    def __init__(self, servers: dict[int, Server], current_datetime: datetime):
+        self._servers = servers
+        self._generations: dict[int, int] = {}
+        self._heap: list[tuple[int, int, int, int]] = []
+        self._last_processed_minute = BaseEvent.get_epoch_minute(current_datetime) - 1
+
+        for server in servers.values():
+            self._heap.extend(self._get_entries(server, current_datetime))
+
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _get_entries(
+        self, server: Server, current_datetime: datetime
+    ) -> list[tuple[int, int, int, int]]:
+        generation = self._generations.get(server.server_id, -1) + 1
+        self._generations[server.server_id] = generation
+
+        earliest_minute = max(
+            BaseEvent.get_epoch_minute(current_datetime),
+            self._last_processed_minute + 1,
+        )
+
+        return [
+            (fire_minute, server.server_id, generation, event_index)
+            for event_index, event in enumerate(server.events)
+            for fire_minute in event.fire_minutes
+            if fire_minute >= earliest_minute
+        ]
+
+    def _is_stale(self, server_id: int, generation: int) -> bool:
+        return self._generations.get(server_id) != generation
+
+    def _discard_stale_entries(self) -> None:
+        while self._heap and self._is_stale(*self._heap[0][1:3]):
+            heapq.heappop(self._heap)
+
+    @property
+    def next_fire_time(self) -> datetime | None:
+        self._discard_stale_entries()
+
+        if not self._heap:
+            return None
+
+        return datetime.fromtimestamp(self._heap[0][0] * 60, timezone.utc)
+
+    def update_server(self, server: Server, current_datetime: datetime) -> None:
+        for entry in self._get_entries(server, current_datetime):
+            heapq.heappush(self._heap, entry)
+
+    def remove_server(self, server_id: int) -> None:
+        self._generations.pop(server_id, None)
+
+    def pop_due(
+        self, current_datetime: datetime, grace_period: timedelta = timedelta()
+    ) -> Generator[tuple[Server, BaseEvent, int], None, None]:
+        current_minute = BaseEvent.get_epoch_minute(current_datetime)
+        earliest_minute = max(
+            BaseEvent.get_epoch_minute(current_datetime - grace_period),
+            self._last_processed_minute + 1,
+        )
+        self._last_processed_minute = max(self._last_processed_minute, current_minute)
+
+        while self._heap and self._heap[0][0] <= current_minute:
+            fire_minute, server_id, generation, event_index = heapq.heappop(self._heap)
+
+            if fire_minute < earliest_minute or self._is_stale(server_id, generation):
+                continue
+
+            server = self._servers[server_id]
+            yield server, server.events[event_index], fire_minute
@@ -1,3 +1,4 @@
-from .client import Client
+from .client import Client, ShardedClient
+from .server_client import ServerClient
 
-__all__ = ["Client"]
+__all__ = ["Client", "ShardedClient", "ServerClient"]
@@ -4,16 +4,16 @@ import discord
 
 from client.command import CommandController
 from client.reaction import ReactionController
-from server import Server
+from client.server_client import ServerClient
 
 logger = logging.getLogger(__name__)
 
 
-class Client(discord.Client):
+class Client(ServerClient):
     async def on_ready(self) -> None:
         logger.info("Logged in as %s", self.user)
 
-        self.servers = Server.from_directory()
+        self._ensure_set_up()
 
     async def on_message(self, message: discord.Message) -> None:
         if message.author == self.user:
@@ -31,3 +31,7 @@ class Client(discord.Client):
             await CommandController.reply(message, server)
         elif ReactionController.is_reactable(message, server):
             await ReactionController.add_reactions(message, server)
+
+
+class ShardedClient(Client, discord.AutoShardedClient):
+    pass
@@ -2,6 +2,7 @@ import logging
 import os
 import re
 from datetime import datetime
+from typing import Awaitable, Callable, ClassVar
 
 import discord
 
@@ -10,53 +11,113 @@ from server import Server
 
 logger = logging.getLogger(__name__)
 
+CommandHandler = Callable[[discord.Message, Server, list[str]], Awaitable[None]]
+
 
 class CommandController:
     EMBED_COLOUR = 0x2F3855
     COMMAND_PREFIX = os.environ.get("QUANTUM_BOT_PREFIX", "!")
-    COMMAND_SPLIT_REGEX = r"((?:[^\s\"']+)|\"(?:\\.|[^\"])*\"|'(?:\\.|[^'])*')"
-    QUOTATION_REMOVAL_REGEX = r"(^[\"']|[\"']$)"
+    COMMAND_SPLIT_REGEX = re.compile(
+        r"\"((?:\\.|[^\"])*)\"|'((?:\\.|[^'])*)'|([^\s\"']+)"
+    )
+
+    _command_handlers: ClassVar[dict[str, CommandHandler]] = {}
 
     @classmethod
     def is_command(cls, message: discord.Message) -> bool:
         return message.content.startswith(cls.COMMAND_PREFIX)
 
     @classmethod
-    async def reply(cls, message: discord.Message, server: Server) -> None:
-        command = [
-            re.sub(cls.QUOTATION_REMOVAL_REGEX, "", arg)
-            for arg in re.findall(cls.COMMAND_SPLIT_REGEX, message.content[1:])
+    def register_command(cls, name: str) -> Callable[[CommandHandler], CommandHandler]:
+        def decorator(handler: CommandHandler) -> CommandHandler:
+            cls._command_handlers[name.lower()] = handler
+            return handler
+
+        return decorator
+
+    @classmethod
+    def parse_command(cls, content: str) -> list[str]:
+        return [
+            "".join(groups)
+            for groups in cls.COMMAND_SPLIT_REGEX.findall(
+                content, len(cls.COMMAND_PREFIX)
+            )
         ]
 
-        match command[0].lower():
-            case "test":
-                await cls._reply_test(message, server)
-            case "schedule":
-                await cls._reply_schedule(message, server, command)
+    @classmethod
+    async def reply(cls, message: discord.Message, server: Server) -> None:
+        command = cls.parse_command(message.content)
+
+        if (
+            not command
+            or (handler := cls._command_handlers.get(command[0].lower())) is None
+        ):
+            return
+
+        await handler(message, server, command)
 
     @classmethod
-    async def _reply_test(cls, message: discord.Message, server: Server) -> None:
-        await message.channel.send(server.language.config.message.test)
+    async def _reply_test(
+        cls, message: discord.Message, server: Server, command: list[str]
+    ) -> None:
+        await message.channel.send(server.render_context.test_message)
+
+    @staticmethod
+    async def _update_embed_titles(
+        embed_splitter: EmbedSplitter,
+        sent_embeds: list[tuple[discord.Message, discord.Embed]],
+    ) -> None:
+        for i, (sent_message, embed) in enumerate(sent_embeds):
+            title = embed_splitter.get_embed_title(i + 1, len(sent_embeds))
+
+            if embed.title != title:
+                embed.title = title
+                await sent_message.edit(embed=embed)
 
     @classmethod
     async def _reply_schedule(
         cls, message: discord.Message, server: Server, command: list[str]
     ) -> None:
+        render_context = server.render_context
         is_full_schedule = len(command) > 1 and command[1].lower() in {"full", "all"}
+        today = datetime.now(render_context.zone_info).date()
+        schedule_kind = "full" if is_full_schedule else "today"
+
+        if (
+            cached_embeds := server.embed_cache.get(
+                schedule_kind, today, server.language
+            )
+        ) is not None:
+            for embed in cached_embeds:
+                await message.channel.send(embed=embed)
+
+            return
 
         if is_full_schedule:
-            schedule_title_prefix = server.language.config.embed.schedule
+            schedule_title = render_context.schedule_title
             fields = server.get_full_schedule_embed_fields()
         else:
-            schedule_title_prefix = server.language.config.embed.schedule_today
-            fields = server.get_todays_schedule_embed_fields(
-                datetime.now(server.timezones[0].zone_info).date()
-            )
+            schedule_title = render_context.schedule_today_title
+            fields = server.get_todays_schedule_embed_fields(today)
+
+        embed = discord.Embed(title=schedule_title, color=cls.EMBED_COLOUR)
+
+        embed_splitter = EmbedSplitter(embed, fields, server.HEADER_PREFIX)
+        sent_embeds: list[tuple[discord.Message, discord.Embed]] = []
 
-        embed = discord.Embed(
-            title=f"{schedule_title_prefix} - {server.name}",
-            color=cls.EMBED_COLOUR,
+        try:
+            for embed in embed_splitter.stream():
+                sent_embeds.append((await message.channel.send(embed=embed), embed))
+        except Exception:
+            await cls._update_embed_titles(embed_splitter, sent_embeds)
+            raise
+
+        await cls._update_embed_titles(embed_splitter, sent_embeds)
+
+        server.embed_cache.set(
+            schedule_kind, today, server.language, [embed for _, embed in sent_embeds]
         )
 
-        for embed in EmbedSplitter(embed, list(fields), server.HEADER_PREFIX):
-            await message.channel.send(embed=embed)
+
+CommandController.register_command("test")(CommandController._reply_test)
+CommandController.register_command("schedule")(CommandController._reply_schedule)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import discord
@@ -8,14 +9,36 @@ logger = logging.getLogger(__name__)
 
 
 class ReactionController:
+    MAX_CONCURRENT_REACTIONS = 3
+
     @classmethod
     def is_reactable(cls, message: discord.Message, server: Server) -> bool:
         if (reaction := server.reactions.get(message.channel.id)) is None:
             return False
 
-        return reaction.prompt_text.lower() in message.content.lower()
+        if (prompt_text := reaction.single_prompt_text) is not None:
+            return prompt_text in message.content.lower()
+
+        return reaction.matches(message.content)
 
     @classmethod
-    async def add_reactions(cls, message: discord.Message, server: Server) -> None:
-        for emoji in server.reactions[message.channel.id].emojis:
+    async def _add_reaction(
+        cls, message: discord.Message, emoji: str, semaphore: asyncio.Semaphore
+    ) -> None:
+        async with semaphore:
             await message.add_reaction(emoji)
+
+    @classmethod
+    async def add_reactions(cls, message: discord.Message, server: Server) -> None:
+        reaction = server.reactions[message.channel.id]
+
+        if reaction.ordered:
+            for emoji in reaction.emojis:
+                await message.add_reaction(emoji)
+
+            return
+
+        semaphore = asyncio.Semaphore(cls.MAX_CONCURRENT_REACTIONS)
+        await asyncio.gather(
+            *(cls._add_reaction(message, emoji, semaphore) for emoji in reaction.emojis)
+        )
@@ -0,0 +1,86 @@
+import logging
+import os
+from typing import Any
+
+import aiocron
+import discord
+
+from server import Server, ServerWatcher
+
+logger = logging.getLogger(__name__)
+
+
+class ServerClient(discord.Client):
+    SERVER_RELOAD_SCHEDULE = (
+        os.environ.get("QUANTUM_BOT_SERVER_RELOAD_SCHEDULE") or "* * * * *"
+    )
+    SHARD_COUNT = os.environ.get("QUANTUM_BOT_SHARD_COUNT") or None
+    SHARD_IDS = os.environ.get("QUANTUM_BOT_SHARD_IDS") or None
+
+    _is_set_up = False
+
+    @classmethod
+    def get_shard_options(cls) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+
+        if cls.SHARD_COUNT is not None:
+            result["shard_count"] = int(cls.SHARD_COUNT)
+
+        if cls.SHARD_IDS is not None:
+            result["shard_ids"] = [int(item) for item in cls.SHARD_IDS.split(",")]
+
+        return result
+
+    def _is_own_server(self, server_id: int) -> bool:
+        shard_ids: list[int] | None = getattr(self, "shard_ids", None)
+        if shard_ids is None or self.shard_count is None:
+            return True
+
+        return (server_id >> 22) % self.shard_count in shard_ids
+
+    def _get_own_servers(self, servers: dict[int, Server]) -> dict[int, Server]:
+        return {
+            server_id: server
+            for server_id, server in servers.items()
+            if self._is_own_server(server_id)
+        }
+
+    def _set_up(self) -> None:
+        self._load_servers()
+
+    def _ensure_set_up(self) -> None:
+        if self._is_set_up:
+            return
+
+        self._is_set_up = True
+        self._set_up()
+
+    def _load_servers(self) -> None:
+        self._server_watcher = ServerWatcher()
+        self.servers: dict[int, Server] = self._get_own_servers(
+            self._server_watcher.load()
+        )
+
+        if self.SERVER_RELOAD_SCHEDULE != "off":
+            self._server_reload_cron = aiocron.crontab(
+                self.SERVER_RELOAD_SCHEDULE, self.reload_servers
+            )
+
+    def _on_servers_reloaded(
+        self, updated_servers: dict[int, Server], removed_server_ids: set[int]
+    ) -> None:
+        pass
+
+    async def reload_servers(self) -> None:
+        updated_servers, removed_server_ids = self._server_watcher.poll()
+        updated_servers = self._get_own_servers(updated_servers)
+        removed_server_ids = removed_server_ids & self.servers.keys()
+
+        if not updated_servers and not removed_server_ids:
+            return
+
+        for server_id in removed_server_ids:
+            self.servers.pop(server_id, None)
+
+        self.servers.update(updated_servers)
+        self._on_servers_reloaded(updated_servers, removed_server_ids)
@@ -0,0 +1,3 @@
+from .combined_client import CombinedClient, ShardedCombinedClient
+
+__all__ = ["CombinedClient", "ShardedCombinedClient"]
@@ -0,0 +1,12 @@
+import discord
+
+from announcement import AnnouncementClient
+from client import Client
+
+
+class CombinedClient(Client, AnnouncementClient):
+    pass
+
+
+class ShardedCombinedClient(CombinedClient, discord.AutoShardedClient):
+    pass
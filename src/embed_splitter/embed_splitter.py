@@ -1,5 +1,5 @@
 from functools import cached_property
-from typing import Iterator
+from typing import Iterable, Iterator
 
 import discord
 
@@ -12,21 +12,13 @@ class EmbedSplitter:
     def __init__(
         self,
         embed: discord.Embed,
-        fields: list[EmbedField],
+        fields: Iterable[EmbedField],
         header_prefix: str | None = None,
     ):
         self._embed = embed
         self._fields = fields
         self._header_prefix = header_prefix
 
-        for i, field in enumerate(self._fields):
-            if self._embed_elements_length + len(field) < self.MAX_COMBINED_LENGTH:
-                continue
-
-            raise ValueError(
-                f"Unable to split fields: Single embed field at index {i} too large"
-            )
-
     @cached_property
     def _embed_elements_length(self) -> int:
         return sum(
@@ -41,42 +33,32 @@ class EmbedSplitter:
         )
 
     def _should_split_embed(
-        self, fields: list[EmbedField], new_field: EmbedField
+        self, field_count: int, fields_length: int, new_field_length: int
     ) -> bool:
-        if len(fields) >= 25:
+        if field_count >= 25:
             return True
 
-        fields_length = sum(map(len, fields))
-
         return (
-            self._embed_elements_length + fields_length + len(new_field)
+            self._embed_elements_length + fields_length + new_field_length
             >= self.MAX_COMBINED_LENGTH
         )
 
-    def _split_embed_fields(
-        self,
-        field_groups: list[list[EmbedField]],
-        is_field_connected_to_previous_field: bool,
-    ) -> None:
-        if is_field_connected_to_previous_field:
-            field_groups.append([field_groups[-1].pop()])
-        else:
-            field_groups.append([])
-
-    def _get_embed_title(self, index: int, total_count: int) -> str | None:
-        if total_count <= 1:
+    def get_embed_title(self, index: int, total_count: int | None) -> str | None:
+        if total_count is not None and total_count <= 1:
             return self._embed.title
 
+        counter = f"{index}/{total_count}" if total_count is not None else str(index)
+
         if self._embed.title is None:
-            return f"({index}/{total_count})"
+            return f"({counter})"
 
-        return f"{self._embed.title} ({index}/{total_count})"
+        return f"{self._embed.title} ({counter})"
 
     def _get_embed_from_fields(
-        self, fields: list[EmbedField], index: int, total_count: int
+        self, fields: list[EmbedField], index: int, total_count: int | None
     ) -> discord.Embed:
         embed = discord.Embed(
-            title=self._get_embed_title(index, total_count), colour=self._embed.colour
+            title=self.get_embed_title(index, total_count), colour=self._embed.colour
         )
 
         for field in fields:
@@ -84,23 +66,49 @@ class EmbedSplitter:
 
         return embed
 
-    def __iter__(self) -> Iterator[discord.Embed]:
-        field_groups: list[list[EmbedField]] = [[]]
+    def _get_field_groups(self) -> Iterator[tuple[list[EmbedField], bool]]:
+        fields: list[EmbedField] = []
+        fields_length = 0
         is_field_connected_to_previous_field = False
 
-        for field in self._fields:
-            if self._should_split_embed(field_groups[-1], field):
-                self._split_embed_fields(
-                    field_groups, is_field_connected_to_previous_field
+        for i, field in enumerate(self._fields):
+            field_length = len(field)
+
+            if self._embed_elements_length + field_length >= self.MAX_COMBINED_LENGTH:
+                raise ValueError(
+                    f"Unable to split fields: Single embed field at index {i} too large"
                 )
 
+            if self._should_split_embed(len(fields), fields_length, field_length):
+                if is_field_connected_to_previous_field:
+                    connected_field = fields.pop()
+                    yield fields, False
+
+                    fields = [connected_field]
+                    fields_length = len(connected_field)
+                else:
+                    yield fields, False
+
+                    fields = []
+                    fields_length = 0
+
             is_field_connected_to_previous_field = (
                 field.name.startswith(self._header_prefix)
                 if self._header_prefix
                 else False
             )
 
-            field_groups[-1].append(field)
+            fields.append(field)
+            fields_length += field_length
+
+        yield fields, True
+
+    def stream(self) -> Iterator[discord.Embed]:
+        for index, (fields, is_last) in enumerate(self._get_field_groups(), 1):
+            yield self._get_embed_from_fields(fields, index, index if is_last else None)
+
+    def __iter__(self) -> Iterator[discord.Embed]:
+        field_groups = list(self._get_field_groups())
 
-        for i, fields in enumerate(field_groups):
+        for i, (fields, _) in enumerate(field_groups):
             yield self._get_embed_from_fields(fields, i + 1, len(field_groups))
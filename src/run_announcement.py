@@ -4,7 +4,7 @@ import sys
 
 import discord
 
-from announcement import AnnouncementClient
+from announcement import AnnouncementClient, ShardedAnnouncementClient
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,7 +14,10 @@ logging.basicConfig(
 
 
 def main() -> None:
-    client = AnnouncementClient(intents=discord.Intents().default())
+    shard_options = AnnouncementClient.get_shard_options()
+    client_class = ShardedAnnouncementClient if shard_options else AnnouncementClient
+
+    client = client_class(intents=discord.Intents().default(), **shard_options)
     client.run(os.environ["BOT_TOKEN"])
 
 
@@ -4,7 +4,7 @@ import sys
 
 import discord
 
-from client import Client
+from client import Client, ShardedClient
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,7 +17,10 @@ def main() -> None:
     intents = discord.Intents().default()
     intents.message_content = True
 
-    client = Client(intents=intents)
+    shard_options = Client.get_shard_options()
+    client_class = ShardedClient if shard_options else Client
+
+    client = client_class(intents=intents, **shard_options)
     client.run(os.environ["BOT_TOKEN"])
 
 
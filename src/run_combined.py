@@ -0,0 +1,28 @@
+import logging
+import os
+import sys
+
+import discord
+
+from combined import CombinedClient, ShardedCombinedClient
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    stream=sys.stdout,
+)
+
+
+def main() -> None:
+    intents = discord.Intents().default()
+    intents.message_content = True
+
+    shard_options = CombinedClient.get_shard_options()
+    client_class = ShardedCombinedClient if shard_options else CombinedClient
+
+    client = client_class(intents=intents, **shard_options)
+    client.run(os.environ["BOT_TOKEN"])
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
@@ -2,5 +2,14 @@ from .base_event import BaseEvent
 from .deadline import Deadline
 from .schedule_event import ScheduleEvent
 from .server import Server
+from .server_watcher import ServerWatcher
+from .zone_info_registry import ZoneInfoRegistry
 
-__all__ = ["Server", "BaseEvent", "ScheduleEvent", "Deadline"]
+__all__ = [
+    "Server",
+    "ServerWatcher",
+    "BaseEvent",
+    "ScheduleEvent",
+    "Deadline",
+    "ZoneInfoRegistry",
+]
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from array import array
 from datetime import datetime
-from typing import ClassVar, Iterable, LiteralString
+from functools import cached_property
+from typing import ClassVar, Iterable, LiteralString, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator, PrivateAttr
 
 from server.timezone import Timezone
 
@@ -15,6 +17,8 @@ class BaseEvent(BaseModel, ABC):
     announcements: list[int]
     description: str | None = Field(default=None)
 
+    _fire_minutes: "array[int]" = PrivateAttr(default_factory=lambda: array("q"))
+
     @property
     @abstractmethod
     def start_time(self) -> datetime: ...  # noqa: E704
@@ -23,11 +27,41 @@ class BaseEvent(BaseModel, ABC):
     @abstractmethod
     def end_time(self) -> datetime: ...  # noqa: E704
 
+    @staticmethod
+    def get_epoch_minute(value: datetime) -> int:
+        return int(value.timestamp()) // 60
+
+    @model_validator(mode="after")
+    def compute_fire_minutes(self) -> Self:
+        start_minute = self.get_epoch_minute(self.start_time)
+        self._fire_minutes = array(
+            "q",
+            sorted(start_minute - announcement for announcement in self.announcements),
+        )
+
+        return self
+
+    @property
+    def fire_minutes(self) -> "array[int]":
+        return self._fire_minutes
+
     @abstractmethod
     def _get_event_time_text(self, timezone: Timezone) -> str: ...  # noqa: E704
 
+    @cached_property
+    def _event_time_texts(self) -> dict[tuple[str, str], str]:
+        return {}
+
+    def _get_cached_event_time_text(self, timezone: Timezone) -> str:
+        key = (timezone.name, timezone.text)
+
+        if (text := self._event_time_texts.get(key)) is None:
+            text = self._event_time_texts[key] = self._get_event_time_text(timezone)
+
+        return text
+
     def _get_event_time_with_timezones(self, timezones: Iterable[Timezone]) -> str:
-        return " | ".join(map(self._get_event_time_text, timezones))
+        return " | ".join(map(self._get_cached_event_time_text, timezones))
 
     def get_embed_name(self, timezones: Iterable[Timezone]) -> str:
         if self.description is None:
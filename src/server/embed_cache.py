@@ -0,0 +1,30 @@
+from datetime import date
+
+import discord
+
+from language import Language
+
+
+class EmbedCache:
+    def __init__(self) -> None:
+        self._day: date | None = None
+        self._embeds: dict[tuple[str, date, Language], list[discord.Embed]] = {}
+
+    def _ensure_day(self, day: date) -> None:
+        if day != self._day:
+            self._day = day
+            self._embeds.clear()
+
+    def get(
+        self, kind: str, day: date, language: Language
+    ) -> list[discord.Embed] | None:
+        self._ensure_day(day)
+
+        return self._embeds.get((kind, day, language))
+
+    def set(
+        self, kind: str, day: date, language: Language, embeds: list[discord.Embed]
+    ) -> None:
+        self._ensure_day(day)
+
+        self._embeds[(kind, day, language)] = embeds
@@ -0,0 +1,81 @@
+from collections import deque
+from typing import Iterable
+
+
+class PromptMatcher:
+    AUTOMATON_MIN_PROMPT_COUNT = 64
+
+    def __init__(self, prompt_texts: Iterable[str]) -> None:
+        self._prompt_texts = list(
+            dict.fromkeys(prompt_text.lower() for prompt_text in prompt_texts)
+        )
+        self._transitions: list[dict[str, int]] | None = None
+        self._is_match_state: list[bool] = []
+
+        if len(self._prompt_texts) >= self.AUTOMATON_MIN_PROMPT_COUNT:
+            self._build_automaton()
+
+    def _build_automaton(self) -> None:
+        children: list[dict[str, int]] = [{}]
+        is_match_state = [False]
+
+        for prompt_text in self._prompt_texts:
+            state = 0
+
+            for character in prompt_text:
+                if (next_state := children[state].get(character)) is None:
+                    next_state = len(children)
+                    children[state][character] = next_state
+                    children.append({})
+                    is_match_state.append(False)
+
+                state = next_state
+
+            is_match_state[state] = True
+
+        transitions = [children[0]] + [{} for _ in children[1:]]
+        fallback_states = [0] * len(children)
+        pending_states = deque(children[0].values())
+
+        while pending_states:
+            state = pending_states.popleft()
+            fallback_state = fallback_states[state]
+
+            transitions[state] = transitions[fallback_state] | children[state]
+            is_match_state[state] = (
+                is_match_state[state] or is_match_state[fallback_state]
+            )
+
+            for character, next_state in children[state].items():
+                fallback_states[next_state] = transitions[fallback_state].get(
+                    character, 0
+                )
+                pending_states.append(next_state)
+
+        self._transitions = transitions
+        self._is_match_state = is_match_state
+
+    def matches(self, content: str) -> bool:
+        content = content.lower()
+
+        if (transitions := self._transitions) is None:
+            for prompt_text in self._prompt_texts:
+                if prompt_text in content:
+                    return True
+
+            return False
+
+        is_match_state = self._is_match_state
+
+        if is_match_state[0]:
+            return True
+
+        state = 0
+
+        for character in content:
+            state = transitions[state].get(character, 0)
+
+            if is_match_state[state]:
+                return True
+
+        return False
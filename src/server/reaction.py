@@ -1,8 +1,39 @@
-from pydantic import BaseModel, ConfigDict
+from functools import cached_property
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from server.prompt_matcher import PromptMatcher
 
 
 class Reaction(BaseModel):
     model_config = ConfigDict(frozen=True)
 
-    prompt_text: str
+    prompt_texts: list[str] = Field(min_length=1)
     emojis: list[str]
+    ordered: bool = True
+
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_prompt_texts(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "prompt_text" in data:
+            data = {
+                "prompt_texts": [data["prompt_text"]],
+                **{key: value for key, value in data.items() if key != "prompt_text"},
+            }
+
+        return data
+
+    @cached_property
+    def single_prompt_text(self) -> str | None:
+        if len(self.prompt_texts) != 1:
+            return None
+
+        return self.prompt_texts[0].lower()
+
+    @cached_property
+    def prompt_matcher(self) -> PromptMatcher:
+        return PromptMatcher(self.prompt_texts)
+
+    def matches(self, content: str) -> bool:
+        return self.prompt_matcher.matches(content)
@@ -0,0 +1,15 @@
+from zoneinfo import ZoneInfo
+
+from language import Language
+from server.timezone import Timezone
+
+
+class RenderContext:
+    def __init__(self, server_name: str, language: Language, timezones: list[Timezone]):
+        config = language.config
+
+        self.zone_info: ZoneInfo = timezones[0].zone_info
+        self.test_message = config.message.test
+        self.reminder_title = config.embed.reminder
+        self.schedule_title = f"{config.embed.schedule} - {server_name}"
+        self.schedule_today_title = f"{config.embed.schedule_today} - {server_name}"
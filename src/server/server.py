@@ -1,10 +1,14 @@
 import logging
+import os
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
-from datetime import date
+from datetime import date, datetime, time, timedelta, timezone
 from functools import cached_property
 from itertools import chain
 from pathlib import Path
-from typing import Any, ClassVar, Generator, LiteralString, Self
+from typing import Any, ClassVar, Generator, Iterable, LiteralString, Self
+from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -12,8 +16,11 @@ from embed_splitter import EmbedField
 from language import Language
 from server.base_event import BaseEvent
 from server.deadline import Deadline
+from server.embed_cache import EmbedCache
 from server.reaction import Reaction
+from server.render_context import RenderContext
 from server.schedule_event import ScheduleEvent
+from server.server_cache import ServerCache
 from server.timezone import Timezone
 
 logger = logging.getLogger(__name__)
@@ -22,6 +29,9 @@ logger = logging.getLogger(__name__)
 class Server(BaseModel):
     DEFAULT_SERVERS_DIRECTORY: ClassVar[Path] = Path.cwd() / "config" / "servers"
     HEADER_PREFIX: ClassVar[LiteralString] = "━━━━━━"
+    SERVER_CACHE_PATH: ClassVar[str | None] = (
+        os.environ.get("QUANTUM_BOT_SERVER_CACHE") or None
+    )
 
     name: str
     server_id: int
@@ -67,36 +77,123 @@ class Server(BaseModel):
         return sorted(chain(self.schedule, self.deadlines), key=lambda x: x.start_time)
 
     @cached_property
-    def events_by_date(self) -> dict[date, list[BaseEvent]]:
+    def event_start_minutes(self) -> "array[int]":
+        return array(
+            "q", (BaseEvent.get_epoch_minute(event.start_time) for event in self.events)
+        )
+
+    @cached_property
+    def embed_cache(self) -> EmbedCache:
+        return EmbedCache()
+
+    @cached_property
+    def render_context(self) -> RenderContext:
+        return RenderContext(self.name, self.language, self.timezones)
+
+    def _get_events_by_date(self, zone_info: ZoneInfo) -> dict[date, list[BaseEvent]]:
         result = defaultdict(list)
         for event in self.events:
-            result[event.start_time.date()].append(event)
+            result[event.start_time.astimezone(zone_info).date()].append(event)
 
         return dict(result)
 
+    @cached_property
+    def events_by_timezone_date(self) -> dict[Timezone, dict[date, list[BaseEvent]]]:
+        return {
+            timezone: self._get_events_by_date(timezone.zone_info)
+            for timezone in self.timezones
+        }
+
+    @property
+    def events_by_date(self) -> dict[date, list[BaseEvent]]:
+        return self.events_by_timezone_date[self.timezones[0]]
+
+    def _get_event_index(self, value: datetime) -> int:
+        return bisect_left(self.event_start_minutes, -(-int(value.timestamp()) // 60))
+
+    def events_between(self, start: datetime, end: datetime) -> list[BaseEvent]:
+        return self.events[self._get_event_index(start) : self._get_event_index(end)]
+
+    def next_events(
+        self, count: int, current_datetime: datetime | None = None
+    ) -> list[BaseEvent]:
+        if current_datetime is None:
+            current_datetime = datetime.now(timezone.utc)
+
+        start = self._get_event_index(current_datetime)
+
+        return self.events[start : start + count]
+
+    def events_on(
+        self, day: date, zone_info: ZoneInfo | None = None
+    ) -> list[BaseEvent]:
+        if zone_info is None:
+            zone_info = self.render_context.zone_info
+
+        return self.events_between(
+            datetime.combine(day, time(), zone_info),
+            datetime.combine(day + timedelta(days=1), time(), zone_info),
+        )
+
     @classmethod
-    def from_directory(
+    def get_config_files(
         cls, directory: Path = DEFAULT_SERVERS_DIRECTORY
-    ) -> dict[int, Self]:
-        files = (
+    ) -> Generator[Path, None, None]:
+        return (
             item
             for item in directory.iterdir()
             if item.is_file() and item.name.endswith(".json")
         )
 
-        servers: dict[int, Self] = {}
+    @classmethod
+    def _from_file(cls, file_path: Path, server_cache: ServerCache | None) -> Self:
+        content = file_path.read_bytes()
+        if server_cache is None:
+            return cls.model_validate_json(content)
+
+        key = server_cache.get_key(content)
+        if isinstance(server := server_cache.get(key), cls):
+            return server
+
+        server = cls.model_validate_json(content)
+        server_cache.set(key, server)
+
+        return server
+
+    @classmethod
+    def from_files(cls, file_paths: Iterable[Path]) -> dict[Path, Self]:
+        server_cache = (
+            ServerCache(Path(cls.SERVER_CACHE_PATH))
+            if cls.SERVER_CACHE_PATH is not None
+            else None
+        )
+
+        servers: dict[Path, Self] = {}
         exceptions: list[Exception] = []
 
-        for file_path in files:
+        for file_path in file_paths:
             try:
-                server = cls.model_validate_json(file_path.read_text())
-                servers[server.server_id] = server
+                servers[file_path] = cls._from_file(file_path, server_cache)
             except Exception as exc:
                 exceptions.append(exc)
 
         if exceptions:
             raise ExceptionGroup("Error loading server data", exceptions)
 
+        if server_cache is not None:
+            server_cache.save()
+
+        return servers
+
+    @classmethod
+    def from_directory(
+        cls, directory: Path = DEFAULT_SERVERS_DIRECTORY
+    ) -> dict[int, Self]:
+        servers = {
+            server.server_id: server
+            for server in cls.from_files(cls.get_config_files(directory)).values()
+        }
+
         logger.info("Successfully loaded %s servers", len(servers))
 
         return servers
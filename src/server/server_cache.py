@@ -0,0 +1,79 @@
+import hashlib
+import logging
+import pickle
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+logger = logging.getLogger(__name__)
+
+
+class ServerCache:
+    def __init__(self, path: Path):
+        self._path = path
+        self._entries = self._read()
+        self._used_entries: dict[str, Any] = {}
+
+    @staticmethod
+    @cache
+    def _get_code_version() -> str:
+        digest = hashlib.sha256(pydantic.VERSION.encode())
+
+        for file_path in sorted(Path(__file__).parent.glob("*.py")):
+            digest.update(file_path.read_bytes())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_key(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with self._path.open("rb") as file:
+                code_version, entries = pickle.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            logger.warning("Unable to read server cache %s", self._path, exc_info=True)
+            return {}
+
+        if code_version != self._get_code_version():
+            return {}
+
+        return dict(entries)
+
+    def get(self, key: str) -> Any | None:
+        if (value := self._entries.get(key)) is not None:
+            self._used_entries[key] = value
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._used_entries[key] = value
+
+    def _write(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor, temporary_name = tempfile.mkstemp(
+            suffix=".tmp", prefix=f"{self._path.name}.", dir=self._path.parent
+        )
+        temporary_path = Path(temporary_name)
+
+        try:
+            with open(file_descriptor, "wb") as file:
+                pickle.dump((self._get_code_version(), self._used_entries), file)
+
+            temporary_path.replace(self._path)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+    def save(self) -> None:
+        try:
+            self._write()
+        except OSError:
+            logger.warning("Unable to save server cache %s", self._path, exc_info=True)
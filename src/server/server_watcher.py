@@ -0,0 +1,69 @@
+import logging
+from pathlib import Path
+
+from server.server import Server
+
+logger = logging.getLogger(__name__)
+
+
+class ServerWatcher:
+    def __init__(self, directory: Path = Server.DEFAULT_SERVERS_DIRECTORY):
+        self._directory = directory
+        self._signatures: dict[Path, tuple[int, int]] = {}
+        self._server_ids: dict[Path, int] = {}
+
+    def _get_signatures(self) -> dict[Path, tuple[int, int]]:
+        result: dict[Path, tuple[int, int]] = {}
+
+        for file_path in Server.get_config_files(self._directory):
+            stat = file_path.stat()
+            result[file_path] = (stat.st_mtime_ns, stat.st_size)
+
+        return result
+
+    def load(self) -> dict[int, Server]:
+        self._signatures = self._get_signatures()
+
+        servers = Server.from_files(self._signatures)
+        self._server_ids = {
+            file_path: server.server_id for file_path, server in servers.items()
+        }
+
+        logger.info("Successfully loaded %s servers", len(servers))
+
+        return {server.server_id: server for server in servers.values()}
+
+    def poll(self) -> tuple[dict[int, Server], set[int]]:
+        signatures = self._get_signatures()
+
+        updated_servers: dict[int, Server] = {}
+        removed_server_ids: set[int] = set()
+
+        for file_path in self._signatures.keys() - signatures.keys():
+            if (server_id := self._server_ids.pop(file_path, None)) is not None:
+                removed_server_ids.add(server_id)
+
+            logger.info("Server configuration %s removed", file_path.name)
+
+        for file_path, signature in signatures.items():
+            if self._signatures.get(file_path) == signature:
+                continue
+
+            try:
+                server = Server.model_validate_json(file_path.read_text())
+            except Exception:
+                logger.exception("Unable to reload server data from %s", file_path.name)
+                continue
+
+            previous_server_id = self._server_ids.get(file_path, server.server_id)
+            if previous_server_id != server.server_id:
+                removed_server_ids.add(previous_server_id)
+
+            self._server_ids[file_path] = server.server_id
+            updated_servers[server.server_id] = server
+
+            logger.info("Server configuration %s reloaded", file_path.name)
+
+        self._signatures = signatures
+
+        return updated_servers, removed_server_ids - updated_servers.keys()
@@ -1,12 +1,13 @@
-from typing import Any, ClassVar
-from zoneinfo import available_timezones, ZoneInfo
+from functools import cached_property
+from typing import Any
+from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from server.zone_info_registry import ZoneInfoRegistry
 
-class Timezone(BaseModel):
-    AVAILABLE_TIMEZONES: ClassVar[frozenset[str]] = frozenset(available_timezones())
 
+class Timezone(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     name: str
@@ -14,15 +15,15 @@ class Timezone(BaseModel):
 
     @field_validator("name", mode="before")
     @classmethod
-    def ensure_name_is_timezone(cls, name: str) -> str:
-        if name not in cls.AVAILABLE_TIMEZONES:
+    def ensure_name_is_timezone(cls, name: Any) -> str:
+        if not isinstance(name, str) or not ZoneInfoRegistry.is_valid(name):
             raise ValueError(f"'{name}' isn't a valid timezone")
 
         return name
 
-    @property
+    @cached_property
     def zone_info(self) -> ZoneInfo:
-        return ZoneInfo(self.name)
+        return ZoneInfoRegistry.get(self.name)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Timezone):
@@ -0,0 +1,31 @@
+from typing import ClassVar
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+class ZoneInfoRegistry:
+    _zone_infos: ClassVar[dict[str, ZoneInfo | None]] = {}
+
+    @classmethod
+    def _resolve(cls, name: str) -> ZoneInfo | None:
+        if name in cls._zone_infos:
+            return cls._zone_infos[name]
+
+        try:
+            zone_info: ZoneInfo | None = ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            zone_info = None
+
+        cls._zone_infos[name] = zone_info
+
+        return zone_info
+
+    @classmethod
+    def is_valid(cls, name: str) -> bool:
+        return cls._resolve(name) is not None
+
+    @classmethod
+    def get(cls, name: str) -> ZoneInfo:
+        if (zone_info := cls._resolve(name)) is None:
+            raise ZoneInfoNotFoundError(f"No time zone found with key {name}")
+
+        return zone_info
@@ -1,7 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 from announcement.announcement import Announcement
-from server import Server
+from server import BaseEvent, Deadline, Server
 
 
 class TestAnnouncement:
@@ -75,3 +77,36 @@ class TestAnnouncement:
 
         # Assert
         assert hash_value == expected_hash
+
+    def test_rendered_once(self, example_server: Server) -> None:
+        # Arrange
+        announcements = [
+            Announcement(example_server, example_server.events[0]) for _ in range(3)
+        ]
+
+        # Act
+        with (
+            patch.object(
+                Deadline,
+                "get_embed_name",
+                autospec=True,
+                side_effect=BaseEvent.get_embed_name,
+            ) as mock_get_embed_name,
+            patch.object(
+                Deadline,
+                "get_embed_value",
+                autospec=True,
+                side_effect=BaseEvent.get_embed_value,
+            ) as mock_get_embed_value,
+        ):
+            unique_announcements = set(announcements)
+            embeds = [item.embed for item in unique_announcements for _ in range(3)]
+            names = [item.name for item in unique_announcements]
+
+        # Assert
+        assert len(unique_announcements) == 1
+        assert all(embed is embeds[0] for embed in embeds)
+        assert names == ["Registration"]
+
+        assert mock_get_embed_name.call_count == len(announcements)
+        assert mock_get_embed_value.call_count == 1
@@ -1,18 +1,45 @@
+import asyncio
 import logging
+import tempfile
+import time
 from datetime import datetime, timezone
-from unittest.mock import call, MagicMock, patch
+from pathlib import Path
+from typing import Generator
+from unittest.mock import AsyncMock, call, MagicMock, patch
 
 import discord
 import pytest
 from freezegun import freeze_time
 
 from announcement.announcement_client import AnnouncementClient
+from announcement.announcement_ledger import AnnouncementLedger
+from announcement.announcement_queue import AnnouncementQueue
 from server import Server
 
 
+class FakeChannel:
+    SEND_LATENCY = 0.05
+
+    def __init__(self, in_flight: list[int]):
+        self._in_flight = in_flight
+        self.sent: list[tuple[float, float, str | None]] = []
+
+        self.mock = MagicMock(discord.abc.Messageable)
+        self.mock.send = AsyncMock(side_effect=self.send)
+
+    async def send(self, content: str, *, embed: discord.Embed) -> None:
+        self._in_flight.append(self._in_flight[-1] + 1)
+        start = time.perf_counter()
+
+        await asyncio.sleep(self.SEND_LATENCY)
+
+        self._in_flight.append(self._in_flight[-1] - 1)
+        self.sent.append((start, time.perf_counter(), embed.fields[0].name))
+
+
 class TestAnnouncementController:
     @pytest.fixture
-    def example_server_from_directory_result(
+    def example_server_watcher_load_result(
         self, example_server: Server
     ) -> dict[int, Server]:
         other_server = example_server.model_copy()
@@ -27,18 +54,23 @@ class TestAnnouncementController:
             other_server.server_id: other_server,
         }
 
+    @pytest.fixture
+    def ledger_path(self) -> Generator[str, None, None]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yield str(Path(tmp_dir) / "announcements.sqlite")
+
     @pytest.mark.asyncio
     @patch("aiocron.crontab")
-    @patch("server.Server.from_directory")
+    @patch("server.ServerWatcher.load")
     async def test_on_ready(
         self,
-        mock_server_from_directory: MagicMock,
+        mock_server_watcher_load: MagicMock,
         mock_aiocron_crontab: MagicMock,
-        example_server_from_directory_result: dict[int, Server],
+        example_server_watcher_load_result: dict[int, Server],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # Arrange
-        mock_server_from_directory.return_value = example_server_from_directory_result
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
 
         expected_log_message = "Logged in as None"
 
@@ -49,29 +81,249 @@ class TestAnnouncementController:
             await announcement_client.on_ready()
 
         # Assert
-        assert announcement_client.servers == example_server_from_directory_result
+        assert announcement_client.servers == example_server_watcher_load_result
 
         assert expected_log_message in caplog.text
 
-        mock_server_from_directory.assert_called_once_with()
+        mock_server_watcher_load.assert_called_once_with()
+
+        assert mock_aiocron_crontab.call_args_list == [
+            call("* * * * *", announcement_client.reload_servers),
+            call("* * * * *", announcement_client.send_announcements),
+        ]
+
+    @pytest.mark.asyncio
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.load")
+    @patch("discord.Client.get_channel")
+    async def test_on_ready_reconnect(
+        self,
+        mock_client_get_channel: MagicMock,
+        mock_server_watcher_load: MagicMock,
+        mock_aiocron_crontab: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+
+        mock_channel = MagicMock(discord.abc.Messageable)
+        mock_client_get_channel.return_value = mock_channel
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+
+        with freeze_time(datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)):
+            await announcement_client.on_ready()
+            announcement_ledger = announcement_client._announcement_ledger
+            announcement_queue = announcement_client._announcement_queue
+            await announcement_client.send_announcements()
+
+        # Act
+        with freeze_time(datetime(2024, 10, 7, 16, 50, 30, tzinfo=timezone.utc)):
+            await announcement_client.on_ready()
+
+        with freeze_time(datetime(2024, 10, 7, 16, 51, tzinfo=timezone.utc)):
+            await announcement_client.send_announcements()
+
+        # Assert
+        mock_channel.send.assert_awaited_once()
+        mock_server_watcher_load.assert_called_once_with()
+        assert announcement_client._announcement_ledger is announcement_ledger
+        assert announcement_client._announcement_queue is announcement_queue
+        assert mock_aiocron_crontab.call_args_list == [
+            call("* * * * *", announcement_client.reload_servers),
+            call("* * * * *", announcement_client.send_announcements),
+        ]
+
+    @pytest.mark.asyncio
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.load")
+    @patch.object(AnnouncementClient, "SCHEDULER_MODE", "sleep")
+    async def test_on_ready_sleep_scheduler(
+        self,
+        mock_server_watcher_load: MagicMock,
+        mock_aiocron_crontab: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
 
+        # Act
+        await announcement_client.on_ready()
+
+        # Assert
         mock_aiocron_crontab.assert_called_once_with(
-            "* * * * *", announcement_client.send_announcements
+            "* * * * *", announcement_client.reload_servers
+        )
+
+        assert not announcement_client._announcement_task.done()
+        announcement_client._announcement_task.cancel()
+
+    @pytest.mark.asyncio
+    @patch("server.ServerWatcher.load")
+    @freeze_time(datetime(2024, 10, 7, 16, 49, 30, tzinfo=timezone.utc))
+    async def test_get_seconds_until_next_announcement(
+        self,
+        mock_server_watcher_load: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        await announcement_client.on_ready()
+
+        # Act
+        seconds = announcement_client._get_seconds_until_next_announcement()
+
+        # Assert
+        assert seconds == 30
+
+    @pytest.mark.asyncio
+    async def test_get_seconds_until_next_announcement_empty_queue(self) -> None:
+        # Arrange
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        announcement_client._announcement_queue = MagicMock(next_fire_time=None)
+
+        # Act
+        seconds = announcement_client._get_seconds_until_next_announcement()
+
+        # Assert
+        assert seconds is None
+
+    @pytest.mark.asyncio
+    @patch.object(AnnouncementClient, "send_announcements", new_callable=AsyncMock)
+    async def test_run_announcement_scheduler(
+        self, mock_send_announcements: AsyncMock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # Arrange
+        mock_send_announcements.side_effect = [
+            ValueError("Some error"),
+            None,
+            asyncio.CancelledError(),
+        ]
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        announcement_client._announcement_queue = MagicMock(
+            next_fire_time=datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)
+        )
+        announcement_client._scheduler_rearmed = asyncio.Event()
+
+        # Act
+        with (
+            pytest.raises(asyncio.CancelledError),
+            caplog.at_level(logging.ERROR, "announcement.announcement_client"),
+        ):
+            await announcement_client._run_announcement_scheduler()
+
+        # Assert
+        assert mock_send_announcements.await_count == 3
+        assert "Unable to send announcements" in caplog.text
+
+    @pytest.mark.asyncio
+    @patch.object(AnnouncementClient, "send_announcements", new_callable=AsyncMock)
+    async def test_rearm_scheduler(self, mock_send_announcements: AsyncMock) -> None:
+        # Arrange
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        announcement_client._announcement_queue = MagicMock(next_fire_time=None)
+        announcement_client._scheduler_rearmed = asyncio.Event()
+
+        task = asyncio.create_task(announcement_client._run_announcement_scheduler())
+        await asyncio.sleep(0)
+
+        announcement_client._announcement_queue.next_fire_time = datetime(
+            2024, 10, 7, 16, 50, tzinfo=timezone.utc
+        )
+
+        # Act
+        announcement_client.rearm_scheduler()
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        # Assert
+        mock_send_announcements.assert_awaited()
+
+    @pytest.mark.asyncio
+    @patch("server.ServerWatcher.load")
+    @freeze_time(datetime(2024, 10, 7, 16, 49, tzinfo=timezone.utc))
+    async def test_on_servers_reloaded(
+        self,
+        mock_server_watcher_load: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        await announcement_client.on_ready()
+
+        updated_server = example_server_watcher_load_result[123456].model_copy(
+            update={"server_id": 1}
         )
+        announcement_client.servers[updated_server.server_id] = updated_server
+        del announcement_client.servers[12345]
+
+        # Act
+        announcement_client._on_servers_reloaded(
+            {updated_server.server_id: updated_server}, {12345}
+        )
+
+        # Assert
+        assert announcement_client._scheduler_rearmed.is_set()
+
+        due = list(
+            announcement_client._announcement_queue.pop_due(
+                datetime(2024, 10, 8, 16, 50, tzinfo=timezone.utc)
+            )
+        )
+        assert [server.server_id for server, _, _ in due] == [1, 123456]
 
     @pytest.mark.asyncio
-    @patch("server.Server.from_directory")
+    @patch("server.ServerWatcher.load")
+    @patch("discord.Client.get_channel")
+    @freeze_time(datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc))
+    async def test_send_announcements_after_reload_in_same_minute(
+        self,
+        mock_client_get_channel: MagicMock,
+        mock_server_watcher_load: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+
+        mock_channel = MagicMock(discord.abc.Messageable)
+        mock_client_get_channel.return_value = mock_channel
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        await announcement_client.on_ready()
+
+        updated_server = example_server_watcher_load_result[12345].model_copy()
+        announcement_client.servers[updated_server.server_id] = updated_server
+
+        # Act
+        announcement_client._on_servers_reloaded(
+            {updated_server.server_id: updated_server}, set()
+        )
+        await announcement_client.send_announcements()
+        await announcement_client.send_announcements()
+
+        # Assert
+        mock_channel.send.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("server.ServerWatcher.load")
     @patch("discord.Client.get_channel")
     @freeze_time(datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc))
     async def test_send_announcements(
         self,
         mock_client_get_channel: MagicMock,
-        mock_server_from_directory: MagicMock,
-        example_server_from_directory_result: dict[int, Server],
+        mock_server_watcher_load: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # Arrange
-        mock_server_from_directory.return_value = example_server_from_directory_result
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
 
         mock_channel = MagicMock(discord.abc.Messageable)
         mock_client_get_channel.return_value = mock_channel
@@ -102,18 +354,47 @@ class TestAnnouncementController:
         mock_channel.send.assert_awaited_once_with("@everyone", embed=expected_embed)
 
     @pytest.mark.asyncio
-    @patch("server.Server.from_directory")
+    @patch("server.ServerWatcher.load")
+    @patch("discord.Client.get_channel")
+    @freeze_time(datetime(2024, 10, 8, 16, 50, tzinfo=timezone.utc))
+    async def test_send_announcements_commits_ledger_once(
+        self,
+        mock_client_get_channel: MagicMock,
+        mock_server_watcher_load: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+        mock_client_get_channel.return_value = MagicMock(discord.abc.Messageable)
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        await announcement_client.on_ready()
+
+        # Act
+        with patch.object(
+            AnnouncementLedger,
+            "commit",
+            wraps=announcement_client._announcement_ledger.commit,
+        ) as mock_commit:
+            await announcement_client.send_announcements()
+
+        # Assert
+        assert mock_client_get_channel.return_value.send.await_count == 2
+        mock_commit.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    @patch("server.ServerWatcher.load")
     @patch("discord.Client.get_channel")
     @freeze_time(datetime(2024, 10, 8, 16, 50, tzinfo=timezone.utc))
     async def test_send_announcements_multiple_announcements(
         self,
         mock_client_get_channel: MagicMock,
-        mock_server_from_directory: MagicMock,
-        example_server_from_directory_result: dict[int, Server],
+        mock_server_watcher_load: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # Arrange
-        mock_server_from_directory.return_value = example_server_from_directory_result
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
 
         mock_channel = MagicMock(discord.abc.Messageable)
         mock_client_get_channel.return_value = mock_channel
@@ -163,17 +444,17 @@ class TestAnnouncementController:
         )
 
     @pytest.mark.asyncio
-    @patch("server.Server.from_directory")
+    @patch("server.ServerWatcher.load")
     @patch("discord.Client.get_channel")
     @freeze_time(datetime(2024, 10, 8, 16, 51, tzinfo=timezone.utc))
     async def test_send_announcements_no_announcements(
         self,
         mock_client_get_channel: MagicMock,
-        mock_server_from_directory: MagicMock,
-        example_server_from_directory_result: dict[int, Server],
+        mock_server_watcher_load: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
     ) -> None:
         # Arrange
-        mock_server_from_directory.return_value = example_server_from_directory_result
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
 
         announcement_client = AnnouncementClient(intents=discord.Intents())
         await announcement_client.on_ready()
@@ -185,18 +466,18 @@ class TestAnnouncementController:
         mock_client_get_channel.assert_not_called()
 
     @pytest.mark.asyncio
-    @patch("server.Server.from_directory")
+    @patch("server.ServerWatcher.load")
     @patch("discord.Client.get_channel")
     @freeze_time(datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc))
     async def test_send_announcements_invalid_channel(
         self,
         mock_client_get_channel: MagicMock,
-        mock_server_from_directory: MagicMock,
+        mock_server_watcher_load: MagicMock,
         caplog: pytest.LogCaptureFixture,
-        example_server_from_directory_result: dict[int, Server],
+        example_server_watcher_load_result: dict[int, Server],
     ) -> None:
         # Arrange
-        mock_server_from_directory.return_value = example_server_from_directory_result
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
 
         mock_channel = MagicMock()
         mock_client_get_channel.return_value = mock_channel
@@ -218,3 +499,192 @@ class TestAnnouncementController:
 
         mock_client_get_channel.assert_called_once_with(54321)
         mock_channel.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("discord.Client.get_channel")
+    @patch.object(
+        AnnouncementClient,
+        "_get_current_datetime",
+        return_value=datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc),
+    )
+    async def test_send_announcements_dispatch_latency(
+        self,
+        mock_get_current_datetime: MagicMock,
+        mock_client_get_channel: MagicMock,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        channel_count = 50
+
+        servers = {
+            i: example_server.model_copy(
+                update={"server_id": i, "announcement_channel_id": i}
+            )
+            for i in range(channel_count)
+        }
+
+        in_flight = [0]
+        channels = [FakeChannel(in_flight) for _ in range(channel_count)]
+        mock_client_get_channel.side_effect = lambda i: channels[i].mock
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        announcement_client._announcement_ledger = AnnouncementLedger()
+        announcement_client._announcement_queue = AnnouncementQueue(
+            servers, mock_get_current_datetime.return_value
+        )
+
+        # Act
+        start = time.perf_counter()
+        await announcement_client.send_announcements()
+        latency = time.perf_counter() - start
+
+        # Assert
+        assert all(len(channel.sent) == 1 for channel in channels)
+        assert max(in_flight) == AnnouncementClient.MAX_CONCURRENT_SENDS
+        assert latency < channel_count * FakeChannel.SEND_LATENCY / 2
+
+    @pytest.mark.asyncio
+    @patch("discord.Client.get_channel")
+    @patch.object(
+        AnnouncementClient,
+        "_get_current_datetime",
+        return_value=datetime(2024, 10, 8, 16, 50, tzinfo=timezone.utc),
+    )
+    async def test_send_announcements_channel_order(
+        self,
+        mock_get_current_datetime: MagicMock,
+        mock_client_get_channel: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        example_server_watcher_load_result[123456].announcement_channel_id = 54321
+
+        channel = FakeChannel([0])
+        mock_client_get_channel.return_value = channel.mock
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        announcement_client._announcement_ledger = AnnouncementLedger()
+        announcement_client._announcement_queue = AnnouncementQueue(
+            example_server_watcher_load_result,
+            mock_get_current_datetime.return_value,
+        )
+
+        # Act
+        await announcement_client.send_announcements()
+
+        # Assert
+        (_, first_end, first_name), (second_start, _, second_name) = channel.sent
+
+        assert first_name == (
+            "Conventional Quantum Algorithms In Qiskit - Part 2: "
+            "17:00 → 20:00 UTC | 19:00 → 22:00 CET"
+        )
+        assert second_name == "Some other event: 17:00 → 20:00 UTC | 19:00 → 22:00 CET"
+        assert first_end <= second_start
+
+    @pytest.mark.asyncio
+    @patch("server.ServerWatcher.load")
+    @patch("discord.Client.get_channel")
+    @freeze_time(datetime(2024, 10, 8, 16, 50, tzinfo=timezone.utc))
+    async def test_send_announcements_multiple_invalid_channels(
+        self,
+        mock_client_get_channel: MagicMock,
+        mock_server_watcher_load: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+
+        mock_client_get_channel.return_value = None
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        await announcement_client.on_ready()
+
+        # Act
+        with pytest.raises(
+            ExceptionGroup, match="Error sending announcements"
+        ) as exc_info:
+            await announcement_client.send_announcements()
+
+        # Assert
+        assert sorted(map(str, exc_info.value.exceptions)) == [
+            "Cannot send messages to channel ID 1234567890",
+            "Cannot send messages to channel ID 54321",
+        ]
+
+    @pytest.mark.asyncio
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.load")
+    @patch("discord.Client.get_channel")
+    async def test_send_announcements_delayed_tick(
+        self,
+        mock_client_get_channel: MagicMock,
+        mock_server_watcher_load: MagicMock,
+        mock_aiocron_crontab: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+
+        mock_channel = MagicMock(discord.abc.Messageable)
+        mock_client_get_channel.return_value = mock_channel
+
+        announcement_client = AnnouncementClient(intents=discord.Intents())
+        with freeze_time(datetime(2024, 10, 7, 16, 49, tzinfo=timezone.utc)):
+            await announcement_client.on_ready()
+
+        # Act
+        with freeze_time(datetime(2024, 10, 7, 16, 52, tzinfo=timezone.utc)):
+            await announcement_client.send_announcements()
+            await announcement_client.send_announcements()
+
+        # Assert
+        mock_channel.send.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("sent_before_restart", "expected_send_count"), [(True, 0), (False, 1)]
+    )
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.load")
+    @patch("discord.Client.get_channel")
+    async def test_send_announcements_after_restart(
+        self,
+        mock_client_get_channel: MagicMock,
+        mock_server_watcher_load: MagicMock,
+        mock_aiocron_crontab: MagicMock,
+        example_server_watcher_load_result: dict[int, Server],
+        ledger_path: str,
+        sent_before_restart: bool,
+        expected_send_count: int,
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = example_server_watcher_load_result
+
+        mock_channel = MagicMock(discord.abc.Messageable)
+        mock_client_get_channel.return_value = mock_channel
+
+        if sent_before_restart:
+            with (
+                patch.object(
+                    AnnouncementClient, "ANNOUNCEMENT_LEDGER_PATH", ledger_path
+                ),
+                freeze_time(datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)),
+            ):
+                announcement_client = AnnouncementClient(intents=discord.Intents())
+                await announcement_client.on_ready()
+                await announcement_client.send_announcements()
+
+        mock_channel.send.reset_mock()
+
+        # Act
+        with (
+            patch.object(AnnouncementClient, "ANNOUNCEMENT_LEDGER_PATH", ledger_path),
+            freeze_time(datetime(2024, 10, 7, 16, 53, tzinfo=timezone.utc)),
+        ):
+            announcement_client = AnnouncementClient(intents=discord.Intents())
+            await announcement_client.on_ready()
+            await announcement_client.send_announcements()
+
+        # Assert
+        assert mock_channel.send.await_count == expected_send_count
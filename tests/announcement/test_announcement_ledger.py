@@ -0,0 +1,92 @@
+import tempfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from announcement.announcement_ledger import AnnouncementLedger
+
+
+class TestAnnouncementLedger:
+    EXAMPLE_CHANNEL_ID = 54321
+    EXAMPLE_NAME = "Some event"
+
+    @pytest.fixture
+    def ledger_path(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yield Path(tmp_dir) / "ledger" / "announcements.sqlite"
+
+    def test_is_persistent(self, ledger_path: Path) -> None:
+        # Act
+        ledger = AnnouncementLedger(ledger_path)
+
+        # Assert
+        assert ledger.is_persistent
+        assert not AnnouncementLedger().is_persistent
+
+    def test_is_sent_empty(self) -> None:
+        # Arrange
+        ledger = AnnouncementLedger()
+
+        # Act
+        is_sent = ledger.is_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 100)
+
+        # Assert
+        assert not is_sent
+
+    def test_mark_sent(self) -> None:
+        # Arrange
+        ledger = AnnouncementLedger()
+
+        # Act
+        ledger.mark_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, [100, 110])
+        ledger.mark_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, [100])
+
+        # Assert
+        assert ledger.is_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 100)
+        assert ledger.is_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 110)
+        assert not ledger.is_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 120)
+        assert not ledger.is_sent(self.EXAMPLE_CHANNEL_ID, "Some other event", 100)
+        assert not ledger.is_sent(1, self.EXAMPLE_NAME, 100)
+
+    def test_mark_sent_persistent(self, ledger_path: Path) -> None:
+        # Arrange
+        ledger = AnnouncementLedger(ledger_path)
+
+        # Act
+        ledger.mark_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, [100])
+        ledger.close()
+
+        # Assert
+        assert AnnouncementLedger(ledger_path).is_sent(
+            self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 100
+        )
+
+    def test_commit(self, ledger_path: Path) -> None:
+        # Arrange
+        ledger = AnnouncementLedger(ledger_path)
+        ledger.mark_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, [100])
+        other_ledger = AnnouncementLedger(ledger_path)
+
+        is_sent_before_commit = other_ledger.is_sent(
+            self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 100
+        )
+
+        # Act
+        ledger.commit()
+
+        # Assert
+        assert not is_sent_before_commit
+        assert other_ledger.is_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 100)
+
+    def test_prune(self) -> None:
+        # Arrange
+        ledger = AnnouncementLedger()
+        ledger.mark_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, [100, 110])
+
+        # Act
+        ledger.prune(110)
+
+        # Assert
+        assert not ledger.is_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 100)
+        assert ledger.is_sent(self.EXAMPLE_CHANNEL_ID, self.EXAMPLE_NAME, 110)
@@ -0,0 +1,216 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from announcement.announcement_queue import AnnouncementQueue
+from server import BaseEvent, Server
+
+
+class TestAnnouncementQueue:
+    @pytest.fixture
+    def example_servers(self, example_server: Server) -> dict[int, Server]:
+        return {example_server.server_id: example_server}
+
+    def test_len(self, example_servers: dict[int, Server]) -> None:
+        # Act
+        queue = AnnouncementQueue(
+            example_servers, datetime(2024, 10, 1, tzinfo=timezone.utc)
+        )
+
+        # Assert
+        assert len(queue) == 10
+
+    def test_len_skips_past_fire_times(
+        self, example_servers: dict[int, Server]
+    ) -> None:
+        # Act
+        queue = AnnouncementQueue(
+            example_servers, datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)
+        )
+
+        # Assert
+        assert len(queue) == 7
+
+    def test_next_fire_time(self, example_servers: dict[int, Server]) -> None:
+        # Arrange
+        queue = AnnouncementQueue(
+            example_servers, datetime(2024, 10, 7, 8, 1, tzinfo=timezone.utc)
+        )
+
+        # Act
+        next_fire_time = queue.next_fire_time
+
+        # Assert
+        assert next_fire_time == datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)
+
+    def test_next_fire_time_empty(self, example_servers: dict[int, Server]) -> None:
+        # Arrange
+        queue = AnnouncementQueue(
+            example_servers, datetime(2024, 10, 12, tzinfo=timezone.utc)
+        )
+
+        # Act
+        next_fire_time = queue.next_fire_time
+
+        # Assert
+        assert next_fire_time is None
+
+    def test_pop_due(
+        self, example_servers: dict[int, Server], example_server: Server
+    ) -> None:
+        # Arrange
+        current_datetime = datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)
+        queue = AnnouncementQueue(example_servers, current_datetime)
+
+        # Act
+        due = list(queue.pop_due(current_datetime))
+
+        # Assert
+        assert due == [
+            (
+                example_server,
+                example_server.events[1],
+                BaseEvent.get_epoch_minute(current_datetime),
+            )
+        ]
+        assert len(queue) == 6
+
+    def test_pop_due_skips_missed_fire_times(
+        self, example_servers: dict[int, Server]
+    ) -> None:
+        # Arrange
+        queue = AnnouncementQueue(
+            example_servers, datetime(2024, 10, 7, tzinfo=timezone.utc)
+        )
+
+        # Act
+        due = list(queue.pop_due(datetime(2024, 10, 7, 16, 49, tzinfo=timezone.utc)))
+
+        # Assert
+        assert due == []
+        assert len(queue) == 7
+
+    def test_pop_due_grace_period(
+        self, example_servers: dict[int, Server], example_server: Server
+    ) -> None:
+        # Arrange
+        fire_datetime = datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)
+        queue = AnnouncementQueue(example_servers, fire_datetime)
+
+        # Act
+        due = list(
+            queue.pop_due(fire_datetime + timedelta(minutes=3), timedelta(minutes=5))
+        )
+
+        # Assert
+        assert due == [
+            (
+                example_server,
+                example_server.events[1],
+                BaseEvent.get_epoch_minute(fire_datetime),
+            )
+        ]
+        assert len(queue) == 6
+
+    def test_pop_due_missed_ticks(
+        self, example_servers: dict[int, Server], example_server: Server
+    ) -> None:
+        # Arrange
+        queue = AnnouncementQueue(
+            example_servers, datetime(2024, 10, 7, 16, 48, tzinfo=timezone.utc)
+        )
+        list(queue.pop_due(datetime(2024, 10, 7, 16, 48, tzinfo=timezone.utc)))
+
+        # Act
+        due = list(
+            queue.pop_due(
+                datetime(2024, 10, 7, 16, 54, tzinfo=timezone.utc),
+                timedelta(minutes=5),
+            )
+        )
+
+        # Assert
+        assert [event for _, event, _ in due] == [example_server.events[1]]
+
+    def test_pop_due_missed_ticks_beyond_grace_period(
+        self, example_servers: dict[int, Server]
+    ) -> None:
+        # Arrange
+        queue = AnnouncementQueue(
+            example_servers, datetime(2024, 10, 7, 16, 48, tzinfo=timezone.utc)
+        )
+
+        # Act
+        due = list(
+            queue.pop_due(
+                datetime(2024, 10, 7, 16, 56, tzinfo=timezone.utc),
+                timedelta(minutes=5),
+            )
+        )
+
+        # Assert
+        assert due == []
+
+    def test_pop_due_processed_minute(
+        self, example_servers: dict[int, Server], example_server: Server
+    ) -> None:
+        # Arrange
+        current_datetime = datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)
+        queue = AnnouncementQueue(example_servers, current_datetime)
+        list(queue.pop_due(current_datetime))
+
+        # Act
+        queue.update_server(example_server, current_datetime - timedelta(minutes=5))
+        due = list(queue.pop_due(current_datetime, timedelta(minutes=5)))
+
+        # Assert
+        assert due == []
+
+    def test_pop_due_nothing_due(self, example_servers: dict[int, Server]) -> None:
+        # Arrange
+        current_datetime = datetime(2024, 10, 7, 16, 51, tzinfo=timezone.utc)
+        queue = AnnouncementQueue(example_servers, current_datetime)
+
+        # Act
+        due = list(queue.pop_due(current_datetime))
+
+        # Assert
+        assert due == []
+        assert len(queue) == 6
+
+    def test_update_server(
+        self, example_servers: dict[int, Server], example_server: Server
+    ) -> None:
+        # Arrange
+        updated_server = example_server.model_copy(
+            update={"schedule": example_server.schedule[1:]}
+        )
+
+        current_datetime = datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)
+        queue = AnnouncementQueue(example_servers, current_datetime)
+
+        example_servers[updated_server.server_id] = updated_server
+
+        # Act
+        queue.update_server(updated_server, current_datetime)
+        due = list(queue.pop_due(current_datetime))
+
+        # Assert
+        assert due == []
+        assert queue.next_fire_time == datetime(
+            2024, 10, 8, 16, 50, tzinfo=timezone.utc
+        )
+
+    def test_remove_server(
+        self, example_servers: dict[int, Server], example_server: Server
+    ) -> None:
+        # Arrange
+        current_datetime = datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)
+        queue = AnnouncementQueue(example_servers, current_datetime)
+
+        # Act
+        queue.remove_server(example_server.server_id)
+
+        # Assert
+        assert queue.next_fire_time is None
+        assert list(queue.pop_due(current_datetime)) == []
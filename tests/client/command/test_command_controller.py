@@ -1,5 +1,9 @@
+import random
+import re
+import time
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from typing import Callable
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
@@ -11,6 +15,34 @@ from server import Server
 
 
 class TestCommandController:
+    REFERENCE_SPLIT_REGEX = r"((?:[^\s\"']+)|\"(?:\\.|[^\"])*\"|'(?:\\.|[^'])*')"
+    REFERENCE_QUOTATION_REMOVAL_REGEX = r"(^[\"']|[\"']$)"
+
+    @classmethod
+    def _parse_command_reference(cls, content: str) -> list[str]:
+        return [
+            re.sub(cls.REFERENCE_QUOTATION_REMOVAL_REGEX, "", arg)
+            for arg in re.findall(cls.REFERENCE_SPLIT_REGEX, content[1:])
+        ]
+
+    @staticmethod
+    def _get_random_messages(count: int) -> list[str]:
+        generator = random.Random(count)
+        words = ["schedule", "full", "all", "today", "test", "Some", "żółw", "\\"]
+
+        def get_argument() -> str:
+            word = " ".join(generator.choices(words, k=generator.randint(1, 3)))
+            quote = generator.choice(["", "", '"', "'"])
+
+            return f"{quote}{word}{quote}" if quote else word.replace(" ", "")
+
+        return [
+            "!"
+            + " " * generator.randint(0, 2)
+            + " ".join(get_argument() for _ in range(generator.randint(1, 4)))
+            for _ in range(count)
+        ]
+
     @pytest.mark.parametrize(
         ("message_content", "expected_result"),
         [
@@ -31,6 +63,66 @@ class TestCommandController:
         # Assert
         assert is_command is expected_result
 
+    @pytest.mark.parametrize(
+        ("message_content", "expected_result"),
+        [
+            ("!schedule", ["schedule"]),
+            ("!schedule   full", ["schedule", "full"]),
+            ('!schedule "full"', ["schedule", "full"]),
+            ("!schedule 'all'", ["schedule", "all"]),
+            (
+                '!test "some \\"quoted\\" text" \'it"s\'',
+                ["test", 'some \\"quoted\\" text', 'it"s'],
+            ),
+            ('!test ""', ["test", ""]),
+            ("!", []),
+        ],
+    )
+    def test_parse_command(
+        self, message_content: str, expected_result: list[str]
+    ) -> None:
+        # Act
+        command = CommandController.parse_command(message_content)
+
+        # Assert
+        assert command == expected_result
+
+    def test_parse_command_matches_reference(
+        self, record_property: Callable[[str, object], None]
+    ) -> None:
+        # Arrange
+        messages = self._get_random_messages(10_000)
+        expected_commands = [
+            self._parse_command_reference(message) for message in messages
+        ]
+
+        # Act
+        start = time.perf_counter()
+        commands = [CommandController.parse_command(message) for message in messages]
+        duration = time.perf_counter() - start
+
+        # Assert
+        assert commands == expected_commands
+        record_property("parse cost per message [us]", duration / len(messages) * 1e6)
+
+    @pytest.mark.asyncio
+    async def test_register_command(self, example_server: Server) -> None:
+        # Arrange
+        mock_message = MagicMock(discord.Message)
+        mock_message.content = '!Ping "some argument"'
+        mock_handler = AsyncMock()
+
+        # Act
+        with patch.dict(CommandController._command_handlers):
+            CommandController.register_command("ping")(mock_handler)
+            await CommandController.reply(mock_message, example_server)
+
+        # Assert
+        mock_handler.assert_awaited_once_with(
+            mock_message, example_server, ["Ping", "some argument"]
+        )
+        assert "ping" not in CommandController._command_handlers
+
     @pytest.mark.asyncio
     async def test_reply_test(self, example_server: Server) -> None:
         # Arrange
@@ -77,6 +169,98 @@ class TestCommandController:
         # Assert
         mock_message.channel.send.assert_awaited_once_with(embed=expected_embed)
 
+    @pytest.mark.asyncio
+    @patch("server.Server.get_full_schedule_embed_fields")
+    async def test_reply_schedule_full_multiple_embeds(
+        self,
+        mock_get_full_schedule_embed_fields: MagicMock,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        embed_fields = [EmbedField(name=str(i), value=str(i * i)) for i in range(60)]
+        mock_get_full_schedule_embed_fields.return_value = iter(embed_fields)
+
+        sent_messages = [MagicMock(discord.Message) for _ in range(3)]
+
+        mock_message = MagicMock(discord.Message)
+        mock_message.channel.send = AsyncMock(side_effect=sent_messages)
+        mock_message.content = "!schedule full"
+
+        expected_embeds = []
+        for i in range(3):
+            expected_embed = discord.Embed(
+                title=f"Schedule - QNickel16 ({i + 1}/3)",
+                colour=CommandController.EMBED_COLOUR,
+            )
+            for field in embed_fields[25 * i : 25 * (i + 1)]:
+                expected_embed.add_field(
+                    name=field.name, value=field.value, inline=field.inline
+                )
+
+            expected_embeds.append(expected_embed)
+
+        # Act
+        await CommandController.reply(mock_message, example_server)
+
+        # Assert
+        assert mock_message.channel.send.await_count == 3
+
+        for sent_message, expected_embed in zip(sent_messages[:2], expected_embeds):
+            sent_message.edit.assert_awaited_once_with(embed=expected_embed)
+
+        sent_messages[2].edit.assert_not_called()
+        mock_message.channel.send.assert_awaited_with(embed=expected_embeds[2])
+
+    @pytest.mark.asyncio
+    @patch("server.Server.get_full_schedule_embed_fields")
+    async def test_reply_schedule_full_field_too_large(
+        self,
+        mock_get_full_schedule_embed_fields: MagicMock,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        embed_fields = [EmbedField(name=str(i), value=str(i * i)) for i in range(60)]
+        embed_fields.append(EmbedField(name="0" * 6000, value="0" * 6000))
+        mock_get_full_schedule_embed_fields.return_value = iter(embed_fields)
+
+        sent_messages = [MagicMock(discord.Message) for _ in range(2)]
+
+        mock_message = MagicMock(discord.Message)
+        mock_message.channel.send = AsyncMock(side_effect=sent_messages)
+        mock_message.content = "!schedule full"
+
+        expected_embeds = []
+        for i in range(2):
+            expected_embed = discord.Embed(
+                title=f"Schedule - QNickel16 ({i + 1}/2)",
+                colour=CommandController.EMBED_COLOUR,
+            )
+            for field in embed_fields[25 * i : 25 * (i + 1)]:
+                expected_embed.add_field(
+                    name=field.name, value=field.value, inline=field.inline
+                )
+
+            expected_embeds.append(expected_embed)
+
+        # Act
+        with pytest.raises(ValueError, match="Single embed field at index 60"):
+            await CommandController.reply(mock_message, example_server)
+
+        # Assert
+        assert mock_message.channel.send.await_count == 2
+
+        for sent_message, expected_embed in zip(sent_messages, expected_embeds):
+            sent_message.edit.assert_awaited_once_with(embed=expected_embed)
+
+        assert (
+            example_server.embed_cache.get(
+                "full",
+                datetime.now(example_server.render_context.zone_info).date(),
+                example_server.language,
+            )
+            is None
+        )
+
     @freeze_time(datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc))
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -108,6 +292,55 @@ class TestCommandController:
         # Assert
         mock_message.channel.send.assert_awaited_once_with(embed=expected_embed)
 
+    @freeze_time(datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc))
+    @pytest.mark.asyncio
+    async def test_reply_schedule_cached(self, example_server: Server) -> None:
+        # Arrange
+        mock_message = MagicMock(discord.Message)
+        mock_message.channel.send = AsyncMock()
+        mock_message.content = "!schedule full"
+
+        await CommandController.reply(mock_message, example_server)
+        expected_embed = mock_message.channel.send.await_args.kwargs["embed"]
+
+        # Act
+        with patch.object(
+            Server,
+            "get_full_schedule_embed_fields",
+            wraps=example_server.get_full_schedule_embed_fields,
+        ) as mock_get_full_schedule_embed_fields:
+            await CommandController.reply(mock_message, example_server)
+
+        # Assert
+        mock_get_full_schedule_embed_fields.assert_not_called()
+        mock_message.channel.send.assert_awaited_with(embed=expected_embed)
+
+    @pytest.mark.asyncio
+    async def test_reply_schedule_cache_expires_next_day(
+        self, example_server: Server
+    ) -> None:
+        # Arrange
+        mock_message = MagicMock(discord.Message)
+        mock_message.channel.send = AsyncMock()
+        mock_message.content = "!schedule"
+
+        with freeze_time(datetime(2024, 10, 7, 16, 50, tzinfo=timezone.utc)):
+            await CommandController.reply(mock_message, example_server)
+
+        # Act
+        with (
+            freeze_time(datetime(2024, 10, 8, 16, 50, tzinfo=timezone.utc)),
+            patch.object(
+                Server,
+                "get_todays_schedule_embed_fields",
+                wraps=example_server.get_todays_schedule_embed_fields,
+            ) as mock_get_todays_schedule_embed_fields,
+        ):
+            await CommandController.reply(mock_message, example_server)
+
+        # Assert
+        mock_get_todays_schedule_embed_fields.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_reply_unknown_command(self, example_server: Server) -> None:
         # Arrange
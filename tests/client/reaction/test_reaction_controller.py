@@ -1,3 +1,9 @@
+import asyncio
+import random
+import string
+import time
+from types import SimpleNamespace
+from typing import Callable, cast
 from unittest.mock import call, MagicMock
 
 import discord
@@ -5,10 +11,73 @@ import pytest
 
 from client.reaction.reaction_controller import ReactionController
 from server import Server
+from server.reaction import Reaction
+
+
+class FakeMessage:
+    LATENCY = 0.05
+
+    def __init__(self, channel_id: int):
+        self.channel = SimpleNamespace(id=channel_id)
+        self.reactions: list[str] = []
+        self.pending_reaction_count = 0
+        self.max_pending_reaction_count = 0
+
+    async def add_reaction(self, emoji: str) -> None:
+        self.pending_reaction_count += 1
+        self.max_pending_reaction_count = max(
+            self.max_pending_reaction_count, self.pending_reaction_count
+        )
+
+        await asyncio.sleep(self.LATENCY)
+
+        self.pending_reaction_count -= 1
+        self.reactions.append(emoji)
 
 
 class TestReactionController:
     EXAMPLE_CHANNEL_ID = 12321
+    TIMING_REPEAT_COUNT = 7
+
+    def _get_random_messages(self, words: list[str]) -> list[discord.Message]:
+        generator = random.Random(0)
+        channels = [
+            SimpleNamespace(id=self.EXAMPLE_CHANNEL_ID),
+            SimpleNamespace(id=self.EXAMPLE_CHANNEL_ID * 2),
+        ]
+
+        return [
+            cast(
+                discord.Message,
+                SimpleNamespace(
+                    channel=generator.choice(channels),
+                    content=" ".join(
+                        generator.choices(words, k=generator.randint(1, 50))
+                    ),
+                ),
+            )
+            for _ in range(10_000)
+        ]
+
+    @staticmethod
+    def _is_reactable_previous(message: discord.Message, server: Server) -> bool:
+        if (reaction := server.reactions.get(message.channel.id)) is None:
+            return False
+
+        return reaction.prompt_texts[0].lower() in message.content.lower()
+
+    @staticmethod
+    def _get_duration(
+        is_reactable: Callable[[discord.Message, Server], bool],
+        messages: list[discord.Message],
+        server: Server,
+    ) -> float:
+        start = time.perf_counter()
+
+        for message in messages:
+            is_reactable(message, server)
+
+        return time.perf_counter() - start
 
     @pytest.mark.parametrize(
         ("message_content", "expected_result"),
@@ -32,6 +101,163 @@ class TestReactionController:
         # Assert
         assert is_reactable is expected_result
 
+    @pytest.mark.parametrize(
+        ("message_content", "expected_result"),
+        [
+            ("Some task (v2)? Done", True),
+            ("SOME TASK (V2)?", True),
+            ("Some task v2", False),
+        ],
+    )
+    def test_is_reactable_special_characters(
+        self, example_server: Server, message_content: str, expected_result: bool
+    ) -> None:
+        # Arrange
+        server = example_server.model_copy(
+            update={
+                "reactions": {
+                    self.EXAMPLE_CHANNEL_ID: Reaction(
+                        prompt_texts=["Task (v2)?"], emojis=["🌕"]
+                    )
+                }
+            }
+        )
+
+        mock_message = MagicMock(discord.Message)
+        mock_message.channel.id = self.EXAMPLE_CHANNEL_ID
+        mock_message.content = message_content
+
+        # Act
+        is_reactable = ReactionController.is_reactable(mock_message, server)
+
+        # Assert
+        assert is_reactable is expected_result
+
+    @pytest.mark.parametrize(
+        ("message_content", "expected_result"),
+        [
+            ("Task: some task", True),
+            ("Workshop is done", True),
+            ("I have a QUESTION", True),
+            ("Example message", False),
+        ],
+    )
+    def test_is_reactable_multiple_prompts(
+        self, example_server: Server, message_content: str, expected_result: bool
+    ) -> None:
+        # Arrange
+        server = example_server.model_copy(
+            update={
+                "reactions": {
+                    self.EXAMPLE_CHANNEL_ID: Reaction(
+                        prompt_texts=["Task", "Workshop", "question"], emojis=["🌕"]
+                    )
+                }
+            }
+        )
+
+        mock_message = MagicMock(discord.Message)
+        mock_message.channel.id = self.EXAMPLE_CHANNEL_ID
+        mock_message.content = message_content
+
+        # Act
+        is_reactable = ReactionController.is_reactable(mock_message, server)
+
+        # Assert
+        assert is_reactable is expected_result
+
+    def test_is_reactable_throughput(
+        self,
+        example_server: Server,
+        record_property: Callable[[str, object], None],
+    ) -> None:
+        # Arrange
+        messages = self._get_random_messages(
+            ["task", "Task:", "TASK", "some", "message", "going", "żółw", "?", "1"]
+        )
+        server = example_server.model_copy(
+            update={
+                "reactions": {
+                    self.EXAMPLE_CHANNEL_ID: Reaction(
+                        prompt_texts=["Task"], emojis=["🌕"]
+                    )
+                }
+            }
+        )
+
+        expected_results = [
+            self._is_reactable_previous(message, server) for message in messages
+        ]
+
+        # Act
+        results = [
+            ReactionController.is_reactable(message, server) for message in messages
+        ]
+        durations = [
+            self._get_duration(is_reactable, messages, server)
+            for _ in range(self.TIMING_REPEAT_COUNT)
+            for is_reactable in [
+                ReactionController.is_reactable,
+                self._is_reactable_previous,
+            ]
+        ]
+        duration = min(durations[::2])
+        previous_duration = min(durations[1::2])
+
+        # Assert
+        assert any(results)
+        assert results == expected_results
+        record_property("throughput [messages/s]", len(messages) / duration)
+        record_property(
+            "previous throughput [messages/s]", len(messages) / previous_duration
+        )
+
+    def test_is_reactable_throughput_multiple_prompts(
+        self,
+        example_server: Server,
+        record_property: Callable[[str, object], None],
+    ) -> None:
+        # Arrange
+        generator = random.Random(0)
+        prompt_texts = [
+            "".join(generator.choices(string.ascii_letters + "żółw", k=8))
+            for _ in range(225)
+        ]
+        messages = self._get_random_messages(
+            ["task", "some", "message", "going", "żółw", "?", "1"] + prompt_texts[:20]
+        )
+
+        server = example_server.model_copy(
+            update={
+                "reactions": {
+                    self.EXAMPLE_CHANNEL_ID: Reaction(
+                        prompt_texts=prompt_texts, emojis=["🌕"]
+                    )
+                }
+            }
+        )
+
+        expected_results = [
+            message.channel.id == self.EXAMPLE_CHANNEL_ID
+            and any(
+                prompt_text.lower() in message.content.lower()
+                for prompt_text in prompt_texts
+            )
+            for message in messages
+        ]
+
+        # Act
+        start = time.perf_counter()
+        results = [
+            ReactionController.is_reactable(message, server) for message in messages
+        ]
+        duration = time.perf_counter() - start
+
+        # Assert
+        assert any(results)
+        assert results == expected_results
+        record_property("throughput [messages/s]", len(messages) / duration)
+
     def test_is_reactable_unknown_channel(self, example_server: Server) -> None:
         # Arrange
         mock_message = MagicMock(discord.Message)
@@ -57,3 +283,43 @@ class TestReactionController:
         assert mock_message.add_reaction.await_args_list == [
             call(item) for item in ["🌕", "🌘", "⏲️"]
         ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("ordered", "expected_max_pending_reaction_count"),
+        [(True, 1), (False, ReactionController.MAX_CONCURRENT_REACTIONS)],
+    )
+    async def test_add_reactions_latency(
+        self,
+        example_server: Server,
+        ordered: bool,
+        expected_max_pending_reaction_count: int,
+        record_property: Callable[[str, object], None],
+    ) -> None:
+        # Arrange
+        emojis = ["🌕", "🌘", "⏲️", "✅", "❌", "❓"]
+        server = example_server.model_copy(
+            update={
+                "reactions": {
+                    self.EXAMPLE_CHANNEL_ID: Reaction(
+                        prompt_texts=["Task"], emojis=emojis, ordered=ordered
+                    )
+                }
+            }
+        )
+
+        message = FakeMessage(self.EXAMPLE_CHANNEL_ID)
+
+        # Act
+        start = time.perf_counter()
+        await ReactionController.add_reactions(cast(discord.Message, message), server)
+        duration = time.perf_counter() - start
+
+        # Assert
+        if ordered:
+            assert message.reactions == emojis
+        else:
+            assert sorted(message.reactions) == sorted(emojis)
+
+        assert message.max_pending_reaction_count == expected_max_pending_reaction_count
+        record_property("latency per message [s]", duration)
@@ -14,16 +14,18 @@ class TestClient:
         return Client(intents=discord.Intents())
 
     @pytest.mark.asyncio
-    @patch("server.Server.from_directory")
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.load")
     async def test_on_ready(
         self,
-        mock_server_from_directory: MagicMock,
+        mock_server_watcher_load: MagicMock,
+        mock_aiocron_crontab: MagicMock,
         example_client: Client,
         example_server: Server,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # Arrange
-        mock_server_from_directory.return_value = {
+        mock_server_watcher_load.return_value = {
             example_server.server_id: example_server
         }
 
@@ -38,7 +40,11 @@ class TestClient:
 
         assert expected_log_message in caplog.text
 
-        mock_server_from_directory.assert_called_once_with()
+        mock_server_watcher_load.assert_called_once_with()
+
+        mock_aiocron_crontab.assert_called_once_with(
+            "* * * * *", example_client.reload_servers
+        )
 
     @pytest.mark.asyncio
     @patch("client.command.CommandController.is_command")
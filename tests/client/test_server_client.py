@@ -0,0 +1,228 @@
+from unittest.mock import call, MagicMock, patch
+
+import discord
+import pytest
+
+from client.client import ShardedClient
+from client.server_client import ServerClient
+from server import Server
+
+
+class TestServerClient:
+    @pytest.fixture
+    def mock_server_watcher(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.fixture
+    def example_client(
+        self, example_server: Server, mock_server_watcher: MagicMock
+    ) -> ServerClient:
+        client = ServerClient(intents=discord.Intents())
+        client.servers = {example_server.server_id: example_server}
+        client._server_watcher = mock_server_watcher
+
+        return client
+
+    @pytest.mark.asyncio
+    @patch.object(ServerClient, "_on_servers_reloaded")
+    async def test_reload_servers(
+        self,
+        mock_on_servers_reloaded: MagicMock,
+        mock_server_watcher: MagicMock,
+        example_client: ServerClient,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        other_server = example_server.model_copy(update={"server_id": 1})
+
+        mock_server_watcher.poll.return_value = (
+            {other_server.server_id: other_server},
+            {example_server.server_id},
+        )
+
+        # Act
+        await example_client.reload_servers()
+
+        # Assert
+        assert example_client.servers == {other_server.server_id: other_server}
+
+        mock_on_servers_reloaded.assert_called_once_with(
+            {other_server.server_id: other_server}, {example_server.server_id}
+        )
+
+    @pytest.mark.asyncio
+    @patch.object(ServerClient, "_on_servers_reloaded")
+    async def test_reload_servers_no_changes(
+        self,
+        mock_on_servers_reloaded: MagicMock,
+        mock_server_watcher: MagicMock,
+        example_client: ServerClient,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        mock_server_watcher.poll.return_value = ({}, set())
+
+        # Act
+        await example_client.reload_servers()
+
+        # Assert
+        assert example_client.servers == {example_server.server_id: example_server}
+
+        mock_on_servers_reloaded.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("shard_count", "shard_ids", "expected_result"),
+        [
+            (None, None, {}),
+            ("4", None, {"shard_count": 4}),
+            ("4", "1,3", {"shard_count": 4, "shard_ids": [1, 3]}),
+        ],
+    )
+    def test_get_shard_options(
+        self,
+        shard_count: str | None,
+        shard_ids: str | None,
+        expected_result: dict[str, object],
+    ) -> None:
+        # Act
+        with (
+            patch.object(ServerClient, "SHARD_COUNT", shard_count),
+            patch.object(ServerClient, "SHARD_IDS", shard_ids),
+        ):
+            shard_options = ServerClient.get_shard_options()
+
+        # Assert
+        assert shard_options == expected_result
+
+    @pytest.mark.parametrize(
+        ("shard_ids", "server_id", "expected_result"),
+        [
+            ([1, 3], 1 << 22, True),
+            ([1, 3], 7 << 22, True),
+            ([1, 3], 2 << 22, False),
+            ([1, 3], 12345, False),
+        ],
+    )
+    def test_is_own_server(
+        self, shard_ids: list[int], server_id: int, expected_result: bool
+    ) -> None:
+        # Arrange
+        client = ShardedClient(
+            intents=discord.Intents(), shard_count=4, shard_ids=shard_ids
+        )
+
+        # Act
+        is_own_server = client._is_own_server(server_id)
+
+        # Assert
+        assert is_own_server is expected_result
+
+    @pytest.mark.parametrize("server_id", [12345, 1 << 22])
+    def test_is_own_server_not_sharded(
+        self, example_client: ServerClient, server_id: int
+    ) -> None:
+        # Act
+        is_own_server = example_client._is_own_server(server_id)
+
+        # Assert
+        assert is_own_server
+
+    @pytest.mark.parametrize("server_id", [12345, 1 << 22])
+    def test_is_own_server_all_shards(self, server_id: int) -> None:
+        # Arrange
+        client = ShardedClient(intents=discord.Intents(), shard_count=4)
+
+        # Act
+        is_own_server = client._is_own_server(server_id)
+
+        # Assert
+        assert is_own_server
+
+    @pytest.mark.parametrize(
+        ("server_reload_schedule", "expected_schedules"),
+        [
+            ("* * * * *", ["* * * * *"]),
+            ("*/15 * * * *", ["*/15 * * * *"]),
+            ("off", []),
+        ],
+    )
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.load")
+    def test_load_servers_reload_schedule(
+        self,
+        mock_server_watcher_load: MagicMock,
+        mock_aiocron_crontab: MagicMock,
+        server_reload_schedule: str,
+        expected_schedules: list[str],
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = {}
+
+        client = ServerClient(intents=discord.Intents())
+
+        # Act
+        with patch.object(
+            ServerClient, "SERVER_RELOAD_SCHEDULE", server_reload_schedule
+        ):
+            client._load_servers()
+
+        # Assert
+        assert mock_aiocron_crontab.call_args_list == [
+            call(schedule, client.reload_servers) for schedule in expected_schedules
+        ]
+
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.load")
+    def test_load_servers_sharded(
+        self,
+        mock_server_watcher_load: MagicMock,
+        mock_aiocron_crontab: MagicMock,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        own_server = example_server.model_copy(update={"server_id": 1 << 22})
+        mock_server_watcher_load.return_value = {
+            example_server.server_id: example_server,
+            own_server.server_id: own_server,
+        }
+
+        client = ShardedClient(intents=discord.Intents(), shard_count=4, shard_ids=[1])
+
+        # Act
+        client._load_servers()
+
+        # Assert
+        assert client.servers == {own_server.server_id: own_server}
+
+    @pytest.mark.asyncio
+    @patch.object(ServerClient, "_on_servers_reloaded")
+    async def test_reload_servers_sharded(
+        self,
+        mock_on_servers_reloaded: MagicMock,
+        mock_server_watcher: MagicMock,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        own_server = example_server.model_copy(update={"server_id": 1 << 22})
+
+        client = ShardedClient(intents=discord.Intents(), shard_count=4, shard_ids=[1])
+        client.servers = {}
+        client._server_watcher = mock_server_watcher
+
+        mock_server_watcher.poll.return_value = (
+            {
+                example_server.server_id: example_server,
+                own_server.server_id: own_server,
+            },
+            {2 << 22},
+        )
+
+        # Act
+        await client.reload_servers()
+
+        # Assert
+        assert client.servers == {own_server.server_id: own_server}
+
+        mock_on_servers_reloaded.assert_called_once_with(
+            {own_server.server_id: own_server}, set()
+        )
@@ -0,0 +1,101 @@
+import logging
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, call, MagicMock, patch
+
+import discord
+import pytest
+from freezegun import freeze_time
+
+from combined.combined_client import CombinedClient
+from server import Server
+
+
+class TestCombinedClient:
+    @pytest.fixture
+    def example_combined_client(self) -> CombinedClient:
+        return CombinedClient(intents=discord.Intents())
+
+    @pytest.mark.asyncio
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.load")
+    @freeze_time(datetime(2024, 10, 1, tzinfo=timezone.utc))
+    async def test_on_ready(
+        self,
+        mock_server_watcher_load: MagicMock,
+        mock_aiocron_crontab: MagicMock,
+        example_combined_client: CombinedClient,
+        example_server: Server,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = {
+            example_server.server_id: example_server
+        }
+
+        # Act
+        with caplog.at_level(logging.INFO, "client.client"):
+            await example_combined_client.on_ready()
+
+        # Assert
+        assert example_combined_client.servers == {
+            example_server.server_id: example_server
+        }
+        assert len(example_combined_client._announcement_queue) == 10
+
+        assert "Logged in as None" in caplog.text
+
+        mock_server_watcher_load.assert_called_once_with()
+
+        assert mock_aiocron_crontab.call_args_list == [
+            call("* * * * *", example_combined_client.reload_servers),
+            call("* * * * *", example_combined_client.send_announcements),
+        ]
+
+    @pytest.mark.asyncio
+    @patch("client.command.CommandController.reply")
+    async def test_on_message(
+        self,
+        command_controller_reply: AsyncMock,
+        example_combined_client: CombinedClient,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        example_combined_client.servers = {example_server.server_id: example_server}
+
+        mock_message = MagicMock(discord.Message)
+        mock_message.guild.id = example_server.server_id
+        mock_message.content = "!schedule"
+
+        # Act
+        await example_combined_client.on_message(mock_message)
+
+        # Assert
+        command_controller_reply.assert_awaited_once_with(mock_message, example_server)
+
+    @pytest.mark.asyncio
+    @patch("aiocron.crontab")
+    @patch("server.ServerWatcher.poll")
+    @patch("server.ServerWatcher.load")
+    @freeze_time(datetime(2024, 10, 1, tzinfo=timezone.utc))
+    async def test_reload_servers(
+        self,
+        mock_server_watcher_load: MagicMock,
+        mock_server_watcher_poll: MagicMock,
+        mock_aiocron_crontab: MagicMock,
+        example_combined_client: CombinedClient,
+        example_server: Server,
+    ) -> None:
+        # Arrange
+        mock_server_watcher_load.return_value = {
+            example_server.server_id: example_server
+        }
+        mock_server_watcher_poll.return_value = ({}, {example_server.server_id})
+
+        await example_combined_client.on_ready()
+
+        # Act
+        await example_combined_client.reload_servers()
+
+        # Assert
+        assert example_combined_client.servers == {}
+        assert example_combined_client._announcement_queue.next_fire_time is None
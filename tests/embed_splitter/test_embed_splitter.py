@@ -1,4 +1,7 @@
+import random
+import time
 from itertools import chain
+from typing import Callable, Iterator
 
 import discord
 import pytest
@@ -47,6 +50,59 @@ class TestEmbedSplitter:
 
         return expected_embed
 
+    @staticmethod
+    def _split_reference(
+        embed: discord.Embed, fields: list[EmbedField], header_prefix: str | None
+    ) -> list[list[EmbedField]]:
+        embed_elements_length = sum(
+            len(item)
+            for item in [
+                embed.title,
+                embed.description,
+                embed.footer.text,
+                embed.author.name,
+            ]
+            if item is not None
+        )
+
+        field_groups: list[list[EmbedField]] = [[]]
+        is_field_connected_to_previous_field = False
+
+        for field in fields:
+            if (
+                len(field_groups[-1]) >= 25
+                or embed_elements_length + sum(map(len, field_groups[-1])) + len(field)
+                >= EmbedSplitter.MAX_COMBINED_LENGTH
+            ):
+                if is_field_connected_to_previous_field:
+                    field_groups.append([field_groups[-1].pop()])
+                else:
+                    field_groups.append([])
+
+            is_field_connected_to_previous_field = (
+                field.name.startswith(header_prefix) if header_prefix else False
+            )
+
+            field_groups[-1].append(field)
+
+        return field_groups
+
+    @staticmethod
+    def _get_random_fields(count: int, header_prefix: str) -> list[EmbedField]:
+        generator = random.Random(count)
+
+        return [
+            EmbedField(
+                name=(
+                    f"{header_prefix} {i}"
+                    if generator.random() < 0.2
+                    else "n" * generator.randint(1, 300)
+                ),
+                value="v" * generator.randint(0, 1500),
+            )
+            for i in range(count)
+        ]
+
     @pytest.fixture
     def example_embed(self, embed_title: str | None) -> discord.Embed:
         return discord.Embed(title=embed_title, colour=self.EXAMPLE_EMBED_COLOUR)
@@ -251,3 +307,183 @@ class TestEmbedSplitter:
             self._get_embed_length(embed) < EmbedSplitter.MAX_COMBINED_LENGTH
             for embed in embeds
         )
+
+    @pytest.mark.parametrize("header_prefix", ["###", None])
+    def test_iter_matches_reference(
+        self,
+        example_embed: discord.Embed,
+        embed_title: str | None,
+        header_prefix: str | None,
+        record_property: Callable[[str, object], None],
+    ) -> None:
+        # Arrange
+        embed_fields = self._get_random_fields(10_000, "###")
+
+        field_groups = self._split_reference(example_embed, embed_fields, header_prefix)
+
+        expected_embeds = [
+            self._get_expected_embed(
+                (
+                    f"{embed_title} ({i + 1}/{len(field_groups)})"
+                    if embed_title is not None
+                    else f"({i + 1}/{len(field_groups)})"
+                ),
+                fields,
+            )
+            for i, fields in enumerate(field_groups)
+        ]
+
+        # Act
+        start = time.perf_counter()
+        embeds = list(EmbedSplitter(example_embed, embed_fields, header_prefix))
+        duration = time.perf_counter() - start
+
+        # Assert
+        assert embeds == expected_embeds
+
+        record_property("duration [s]", duration)
+
+    def test_stream(
+        self, example_embed: discord.Embed, embed_title: str | None
+    ) -> None:
+        # Arrange
+        embed_fields = [EmbedField(name=str(i), value=str(i * i)) for i in range(60)]
+
+        expected_embeds = [
+            self._get_expected_embed(
+                (
+                    f"{embed_title} ({counter})"
+                    if embed_title is not None
+                    else f"({counter})"
+                ),
+                fields,
+            )
+            for counter, fields in [
+                ("1", embed_fields[:25]),
+                ("2", embed_fields[25:50]),
+                ("3/3", embed_fields[50:]),
+            ]
+        ]
+
+        # Act
+        embeds = list(EmbedSplitter(example_embed, embed_fields).stream())
+
+        # Assert
+        assert embeds == expected_embeds
+
+    def test_stream_single_field_too_large(
+        self, example_embed: discord.Embed, embed_title: str | None
+    ) -> None:
+        # Arrange
+        embed_fields = [EmbedField(name=str(i), value=str(i * i)) for i in range(30)]
+        embed_fields.append(EmbedField(name="0" * 6000, value="0" * 6000))
+
+        expected_embed = self._get_expected_embed(
+            f"{embed_title} (1)" if embed_title is not None else "(1)",
+            embed_fields[:25],
+        )
+        expected_error_message = (
+            "Unable to split fields: Single embed field at index 30 too large"
+        )
+
+        embeds = EmbedSplitter(example_embed, embed_fields).stream()
+
+        # Act
+        embed = next(embeds)
+
+        # Assert
+        assert embed == expected_embed
+
+        with pytest.raises(ValueError, match=expected_error_message):
+            next(embeds)
+
+    def test_stream_single_embed(
+        self, example_embed: discord.Embed, embed_title: str | None
+    ) -> None:
+        # Arrange
+        embed_fields = [EmbedField(name="Some name", value="Some value")]
+
+        expected_embed = self._get_expected_embed(embed_title, embed_fields)
+
+        # Act
+        embeds = list(EmbedSplitter(example_embed, embed_fields).stream())
+
+        # Assert
+        assert embeds == [expected_embed]
+
+    def test_stream_consumes_fields_lazily(
+        self, example_embed: discord.Embed, embed_title: str | None
+    ) -> None:
+        # Arrange
+        consumed_fields: list[EmbedField] = []
+        expected_embed = self._get_expected_embed(
+            f"{embed_title} (1)" if embed_title is not None else "(1)",
+            [EmbedField(name=str(i), value=str(i * i)) for i in range(25)],
+        )
+
+        def get_fields() -> Iterator[EmbedField]:
+            for i in range(60):
+                field = EmbedField(name=str(i), value=str(i * i))
+                consumed_fields.append(field)
+                yield field
+
+        # Act
+        embed = next(EmbedSplitter(example_embed, get_fields()).stream())
+
+        # Assert
+        assert embed.fields == expected_embed.fields
+        assert embed.title == expected_embed.title
+        assert len(consumed_fields) == 26  # The 26th field triggers the split
+
+    def test_stream_last_group_full(
+        self, example_embed: discord.Embed, embed_title: str | None
+    ) -> None:
+        # Arrange
+        embed_fields = [EmbedField(name=str(i), value=str(i * i)) for i in range(50)]
+
+        expected_embeds = [
+            self._get_expected_embed(
+                (
+                    f"{embed_title} ({counter})"
+                    if embed_title is not None
+                    else f"({counter})"
+                ),
+                fields,
+            )
+            for counter, fields in [
+                ("1", embed_fields[:25]),
+                ("2/2", embed_fields[25:]),
+            ]
+        ]
+
+        # Act
+        embeds = list(EmbedSplitter(example_embed, embed_fields).stream())
+
+        # Assert
+        assert embeds == expected_embeds
+
+    @pytest.mark.parametrize(
+        ("index", "total_count", "expected_counter"),
+        [(1, 3, "1/3"), (3, 3, "3/3"), (2, None, "2"), (1, 1, None)],
+    )
+    def test_get_embed_title(
+        self,
+        example_embed: discord.Embed,
+        embed_title: str | None,
+        index: int,
+        total_count: int | None,
+        expected_counter: str | None,
+    ) -> None:
+        # Arrange
+        if expected_counter is None:
+            expected_title = embed_title
+        elif embed_title is None:
+            expected_title = f"({expected_counter})"
+        else:
+            expected_title = f"{embed_title} ({expected_counter})"
+
+        # Act
+        title = EmbedSplitter(example_embed, []).get_embed_title(index, total_count)
+
+        # Assert
+        assert title == expected_title
@@ -54,6 +54,22 @@ class TestScheduleEvent:
         # Assert
         assert end_time == example_deadline.time
 
+    def test_fire_minutes(self, example_deadline: Deadline) -> None:
+        # Arrange
+        expected_fire_minutes = [
+            Deadline.get_epoch_minute(
+                datetime(2024, 10, 11, hour, minute, tzinfo=timezone.utc)
+            )
+            for hour, minute in [(8, 0), (9, 0), (9, 50)]
+        ]
+
+        # Act
+        fire_minutes = example_deadline.fire_minutes
+
+        # Assert
+        assert fire_minutes.typecode == "q"
+        assert list(fire_minutes) == expected_fire_minutes
+
     @pytest.mark.parametrize(
         ("timezones", "expected_title"),
         [
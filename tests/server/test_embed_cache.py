@@ -0,0 +1,47 @@
+from datetime import date
+
+import discord
+
+from language import Language
+from server.embed_cache import EmbedCache
+
+
+class TestEmbedCache:
+    EXAMPLE_DAY = date(2024, 10, 7)
+
+    def test_get_missing(self) -> None:
+        # Arrange
+        embed_cache = EmbedCache()
+
+        # Act
+        embeds = embed_cache.get("full", self.EXAMPLE_DAY, Language.EN)
+
+        # Assert
+        assert embeds is None
+
+    def test_set(self) -> None:
+        # Arrange
+        embed_cache = EmbedCache()
+        expected_embeds = [discord.Embed(title="Schedule")]
+
+        # Act
+        embed_cache.set("full", self.EXAMPLE_DAY, Language.EN, expected_embeds)
+
+        # Assert
+        assert embed_cache.get("full", self.EXAMPLE_DAY, Language.EN) == expected_embeds
+        assert embed_cache.get("today", self.EXAMPLE_DAY, Language.EN) is None
+
+    def test_set_clears_previous_day(self) -> None:
+        # Arrange
+        embed_cache = EmbedCache()
+        embed_cache.set(
+            "full", self.EXAMPLE_DAY, Language.EN, [discord.Embed(title="Old")]
+        )
+
+        # Act
+        embed_cache.set(
+            "today", date(2024, 10, 8), Language.EN, [discord.Embed(title="New")]
+        )
+
+        # Assert
+        assert embed_cache.get("full", self.EXAMPLE_DAY, Language.EN) is None
@@ -0,0 +1,175 @@
+import random
+import string
+import time
+from typing import Callable
+
+import pytest
+
+from server.prompt_matcher import PromptMatcher
+
+
+class TestPromptMatcher:
+    TIMING_REPEAT_COUNT = 7
+
+    @pytest.fixture
+    def generator(self) -> random.Random:
+        return random.Random(0)
+
+    def _get_random_word(self, generator: random.Random, length: int) -> str:
+        return "".join(generator.choices(string.ascii_letters + "ąęłóśżź", k=length))
+
+    def _get_random_messages(
+        self, generator: random.Random, prompt_texts: list[str]
+    ) -> list[str]:
+        messages = [
+            " ".join(
+                self._get_random_word(generator, generator.randint(2, 9))
+                for _ in range(generator.randint(5, 40))
+            )
+            for _ in range(2_000)
+        ]
+
+        return [
+            (
+                f"{message} {generator.choice(prompt_texts).upper()}"
+                if i % 10 == 0
+                else message
+            )
+            for i, message in enumerate(messages)
+        ]
+
+    @staticmethod
+    def _get_duration(matcher: PromptMatcher, messages: list[str]) -> float:
+        start = time.perf_counter()
+
+        for message in messages:
+            matcher.matches(message)
+
+        return time.perf_counter() - start
+
+    @pytest.mark.parametrize("prompt_count", [4, 200])
+    @pytest.mark.parametrize(
+        ("content", "expected_result"),
+        [
+            ("ushers", True),
+            ("She sells", True),
+            ("HIS hat", True),
+            ("hi, all", False),
+            ("", False),
+        ],
+    )
+    def test_matches(
+        self,
+        generator: random.Random,
+        prompt_count: int,
+        content: str,
+        expected_result: bool,
+    ) -> None:
+        # Arrange
+        prompt_texts = ["he", "She", "his", "hers"]
+        prompt_texts += [
+            self._get_random_word(generator, 12) + "0"
+            for _ in range(prompt_count - len(prompt_texts))
+        ]
+        matcher = PromptMatcher(prompt_texts)
+
+        # Act
+        matches = matcher.matches(content)
+
+        # Assert
+        assert matches is expected_result
+
+    def test_matches_empty_prompt(self) -> None:
+        # Arrange
+        matcher = PromptMatcher(
+            [""] + [str(i) for i in range(PromptMatcher.AUTOMATON_MIN_PROMPT_COUNT)]
+        )
+
+        # Act
+        matches = matcher.matches("Example message")
+
+        # Assert
+        assert matches
+
+    @pytest.mark.parametrize(
+        ("prompt_count", "expected_automaton"),
+        [
+            (PromptMatcher.AUTOMATON_MIN_PROMPT_COUNT - 1, False),
+            (PromptMatcher.AUTOMATON_MIN_PROMPT_COUNT, True),
+        ],
+    )
+    def test_automaton_threshold(
+        self, generator: random.Random, prompt_count: int, expected_automaton: bool
+    ) -> None:
+        # Act
+        matcher = PromptMatcher(
+            [self._get_random_word(generator, 8) for _ in range(prompt_count)]
+        )
+
+        # Assert
+        assert (matcher._transitions is not None) is expected_automaton
+
+    @pytest.mark.parametrize("prompt_count", [4, 64, 256])
+    def test_matches_random_prompts(
+        self, generator: random.Random, prompt_count: int
+    ) -> None:
+        # Arrange
+        prompt_texts = [
+            self._get_random_word(generator, 8) for _ in range(prompt_count)
+        ]
+        messages = self._get_random_messages(generator, prompt_texts)
+
+        expected_results = [
+            any(prompt_text.lower() in message.lower() for prompt_text in prompt_texts)
+            for message in messages
+        ]
+
+        matcher = PromptMatcher(prompt_texts)
+
+        # Act
+        results = [matcher.matches(message) for message in messages]
+
+        # Assert
+        assert any(results)
+        assert results == expected_results
+
+    def test_automaton_throughput(
+        self,
+        generator: random.Random,
+        monkeypatch: pytest.MonkeyPatch,
+        record_property: Callable[[str, object], None],
+    ) -> None:
+        # Arrange
+        prompt_texts = [
+            self._get_random_word(generator, 8)
+            for _ in range(4 * PromptMatcher.AUTOMATON_MIN_PROMPT_COUNT)
+        ]
+        messages = self._get_random_messages(generator, prompt_texts)
+
+        automaton_matcher = PromptMatcher(prompt_texts)
+        monkeypatch.setattr(
+            PromptMatcher, "AUTOMATON_MIN_PROMPT_COUNT", len(prompt_texts) + 1
+        )
+        substring_matcher = PromptMatcher(prompt_texts)
+
+        # Act
+        durations = [
+            self._get_duration(matcher, messages)
+            for _ in range(self.TIMING_REPEAT_COUNT)
+            for matcher in [automaton_matcher, substring_matcher]
+        ]
+        automaton_duration = min(durations[::2])
+        substring_duration = min(durations[1::2])
+
+        # Assert
+        assert automaton_matcher._transitions is not None
+        assert substring_matcher._transitions is None
+        assert [automaton_matcher.matches(message) for message in messages] == [
+            substring_matcher.matches(message) for message in messages
+        ]
+        record_property(
+            "automaton throughput [messages/s]", len(messages) / automaton_duration
+        )
+        record_property(
+            "substring throughput [messages/s]", len(messages) / substring_duration
+        )
@@ -0,0 +1,36 @@
+import pytest
+
+from server.reaction import Reaction
+
+
+class TestReaction:
+    def test_validate_prompt_text(self) -> None:
+        # Act
+        reaction = Reaction.model_validate({"prompt_text": "Task", "emojis": ["🌕"]})
+
+        # Assert
+        assert reaction == Reaction(prompt_texts=["Task"], emojis=["🌕"])
+
+    def test_validate_no_prompt_texts(self) -> None:
+        # Act
+        with pytest.raises(ValueError, match="at least 1 item"):
+            Reaction.model_validate({"prompt_texts": [], "emojis": ["🌕"]})
+
+    @pytest.mark.parametrize(
+        ("content", "expected_result"),
+        [
+            ("Some task", True),
+            ("workshop: done", True),
+            ("Workshops", True),
+            ("Example message", False),
+        ],
+    )
+    def test_matches(self, content: str, expected_result: bool) -> None:
+        # Arrange
+        reaction = Reaction(prompt_texts=["task", "Workshop"], emojis=["🌕"])
+
+        # Act
+        matches = reaction.matches(content)
+
+        # Assert
+        assert matches is expected_result
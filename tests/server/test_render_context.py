@@ -0,0 +1,26 @@
+from zoneinfo import ZoneInfo
+
+from server import Server
+
+
+class TestRenderContext:
+    def test_render_context(self, example_server: Server) -> None:
+        # Act
+        render_context = example_server.render_context
+
+        # Assert
+        assert render_context.zone_info == ZoneInfo("UTC")
+        assert render_context.test_message == (
+            "If you can see this message and it's in the expected "
+            "language, that means the configuration is correct!"
+        )
+        assert render_context.reminder_title == "Reminder!"
+        assert render_context.schedule_title == "Schedule - QNickel16"
+        assert render_context.schedule_today_title == "Today's schedule - QNickel16"
+
+    def test_render_context_reused(self, example_server: Server) -> None:
+        # Act
+        render_context = example_server.render_context
+
+        # Assert
+        assert example_server.render_context is render_context
@@ -75,6 +75,30 @@ class TestScheduleEvent:
         # Assert
         assert end_time == example_schedule_event.end
 
+    def test_fire_minutes(self, example_schedule_event: ScheduleEvent) -> None:
+        # Arrange
+        expected_fire_minutes = [
+            ScheduleEvent.get_epoch_minute(
+                datetime(2024, 10, 9, 14, 57, tzinfo=timezone.utc)
+            )
+        ]
+
+        # Act
+        fire_minutes = example_schedule_event.fire_minutes
+
+        # Assert
+        assert fire_minutes.typecode == "q"
+        assert list(fire_minutes) == expected_fire_minutes
+
+    def test_get_epoch_minute(self) -> None:
+        # Act
+        epoch_minute = ScheduleEvent.get_epoch_minute(
+            datetime(1970, 1, 2, 0, 1, 59, tzinfo=timezone.utc)
+        )
+
+        # Assert
+        assert epoch_minute == 24 * 60 + 1
+
     @pytest.mark.parametrize(
         ("timezones", "expected_title"),
         [
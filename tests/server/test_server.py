@@ -1,11 +1,14 @@
 import json
 import logging
 import tempfile
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, cast, Generator
+from unittest.mock import patch, PropertyMock
+from zoneinfo import ZoneInfo
 
 import pytest
+from freezegun import freeze_time
 
 from embed_splitter import EmbedField
 from language import Language
@@ -30,7 +33,9 @@ class TestServer:
             name="QNickel16",
             server_id=12345,
             announcement_channel_id=54321,
-            reactions={12321: Reaction(prompt_text="Task", emojis=["🌕", "🌘", "⏲️"])},
+            reactions={
+                12321: Reaction(prompt_texts=["Task"], emojis=["🌕", "🌘", "⏲️"])
+            },
             language=Language.EN,
             timezones=[
                 Timezone(name="UTC", text="UTC"),
@@ -186,6 +191,165 @@ class TestServer:
         assert events_by_date == expected_events_by_date
         assert sorted(events_by_date.keys()) == list(events_by_date.keys())
 
+    def test_events_by_timezone_date(
+        self, server_configuration_json: dict[str, Any]
+    ) -> None:
+        # Arrange
+        server_configuration_json["timezones"] = ["Asia/Tokyo", "UTC"]
+        server = Server.model_validate(server_configuration_json)
+
+        expected_tokyo_events_by_date: dict[date, list[BaseEvent]] = {
+            date(2024, 10, 7): [server.deadlines[0]],
+            date(2024, 10, 8): [server.schedule[0]],
+            date(2024, 10, 9): [server.schedule[1]],
+            date(2024, 10, 10): [server.schedule[2], server.deadlines[1]],
+            date(2024, 10, 11): [server.deadlines[2]],
+        }
+
+        # Act
+        events_by_timezone_date = server.events_by_timezone_date
+
+        # Assert
+        assert events_by_timezone_date[server.timezones[0]] == (
+            expected_tokyo_events_by_date
+        )
+        assert events_by_timezone_date[server.timezones[1]][date(2024, 10, 7)] == [
+            server.deadlines[0],
+            server.schedule[0],
+        ]
+        assert server.events_by_date is events_by_timezone_date[server.timezones[0]]
+
+    def test_get_todays_schedule_embed_fields_primary_timezone(
+        self, server_configuration_json: dict[str, Any]
+    ) -> None:
+        # Arrange
+        server_configuration_json["timezones"] = ["Asia/Tokyo", "UTC"]
+        server = Server.model_validate(server_configuration_json)
+
+        # Act
+        embed_fields = list(server.get_todays_schedule_embed_fields(date(2024, 10, 8)))
+
+        # Assert
+        assert [field.name for field in embed_fields] == [
+            server.schedule[0].get_embed_name(server.timezones)
+        ]
+
+    @pytest.mark.parametrize(
+        ("start", "end", "expected_event_indexes"),
+        [
+            (
+                datetime(2024, 10, 7, tzinfo=timezone.utc),
+                datetime(2024, 10, 9, tzinfo=timezone.utc),
+                [0, 1, 2],
+            ),
+            (
+                datetime(2024, 10, 7, 17, tzinfo=timezone.utc),
+                datetime(2024, 10, 10, 10, tzinfo=timezone.utc),
+                [1, 2, 3],
+            ),
+            (
+                datetime(2024, 10, 7, 17, 0, 30, tzinfo=timezone.utc),
+                datetime(2024, 10, 10, 10, 0, 30, tzinfo=timezone.utc),
+                [2, 3, 4],
+            ),
+            (
+                datetime(2024, 10, 12, tzinfo=timezone.utc),
+                datetime(2024, 10, 13, tzinfo=timezone.utc),
+                [],
+            ),
+        ],
+    )
+    def test_events_between(
+        self,
+        example_server: Server,
+        start: datetime,
+        end: datetime,
+        expected_event_indexes: list[int],
+    ) -> None:
+        # Act
+        events = example_server.events_between(start, end)
+
+        # Assert
+        assert events == [example_server.events[i] for i in expected_event_indexes]
+
+    @pytest.mark.parametrize(
+        ("count", "current_datetime", "expected_event_indexes"),
+        [
+            (2, datetime(2024, 10, 7, 12, tzinfo=timezone.utc), [1, 2]),
+            (5, datetime(2024, 10, 9, 17, tzinfo=timezone.utc), [3, 4, 5]),
+            (5, datetime(2024, 10, 12, tzinfo=timezone.utc), []),
+        ],
+    )
+    def test_next_events(
+        self,
+        example_server: Server,
+        count: int,
+        current_datetime: datetime,
+        expected_event_indexes: list[int],
+    ) -> None:
+        # Act
+        events = example_server.next_events(count, current_datetime)
+
+        # Assert
+        assert events == [example_server.events[i] for i in expected_event_indexes]
+
+    @freeze_time(datetime(2024, 10, 8, 12, tzinfo=timezone.utc))
+    def test_next_events_now(self, example_server: Server) -> None:
+        # Act
+        events = example_server.next_events(1)
+
+        # Assert
+        assert events == [example_server.schedule[1]]
+
+    @pytest.mark.parametrize(
+        ("zone_info", "expected_event_indexes"),
+        [(None, [0, 1]), (ZoneInfo("Asia/Tokyo"), [0])],
+    )
+    def test_events_on(
+        self,
+        example_server: Server,
+        zone_info: ZoneInfo | None,
+        expected_event_indexes: list[int],
+    ) -> None:
+        # Act
+        events = example_server.events_on(date(2024, 10, 7), zone_info)
+
+        # Assert
+        assert events == [example_server.events[i] for i in expected_event_indexes]
+
+    def test_events_between_does_not_scan_events(self) -> None:
+        # Arrange
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        server = Server(
+            name="Some server",
+            server_id=1,
+            announcement_channel_id=2,
+            language=Language.EN,
+            timezones=[Timezone(name="UTC", text="UTC")],
+            schedule=[
+                ScheduleEvent(
+                    title=f"Lecture {i}",
+                    start=start + timedelta(hours=i),
+                    end=start + timedelta(hours=i, minutes=45),
+                )
+                for i in range(10_000)
+            ],
+        )
+        server.event_start_minutes
+
+        # Act
+        with patch.object(
+            ScheduleEvent, "start_time", new_callable=PropertyMock
+        ) as mock_start_time:
+            events = server.events_between(
+                start + timedelta(days=100), start + timedelta(days=107)
+            )
+
+        # Assert
+        assert len(events) == 7 * 24
+        assert events[0].title == "Lecture 2400"
+        mock_start_time.assert_not_called()
+
     def test_from_directory(
         self,
         example_server: Server,
@@ -211,6 +375,54 @@ class TestServer:
         assert servers == expected_servers
         assert "Successfully loaded 3 servers" in caplog.text
 
+    def test_from_directory_with_cache(
+        self,
+        server_configuration_json: dict[str, Any],
+        directory_with_configs: Path,
+    ) -> None:
+        # Arrange
+        cache_path = directory_with_configs / "cache" / "servers.pickle"
+
+        with patch.object(Server, "SERVER_CACHE_PATH", str(cache_path)):
+            expected_servers = Server.from_directory(directory_with_configs)
+
+        server_configuration_json["name"] = "Modified server"
+        server_configuration_json["server_id"] = 1
+
+        server_configuration_path = directory_with_configs / "server_1.json"
+        server_configuration_path.write_text(json.dumps(server_configuration_json))
+
+        expected_servers[1] = Server.model_validate(server_configuration_json)
+
+        # Act
+        with (
+            patch.object(Server, "SERVER_CACHE_PATH", str(cache_path)),
+            patch.object(
+                Server, "model_validate_json", wraps=Server.model_validate_json
+            ) as mock_model_validate_json,
+        ):
+            servers = Server.from_directory(directory_with_configs)
+
+        # Assert
+        assert servers == expected_servers
+
+        mock_model_validate_json.assert_called_once_with(
+            server_configuration_path.read_bytes()
+        )
+
+    def test_from_directory_unwritable_cache(
+        self, example_server: Server, directory_with_configs: Path
+    ) -> None:
+        # Arrange
+        cache_path = directory_with_configs / "server_0.json" / "servers.pickle"
+
+        # Act
+        with patch.object(Server, "SERVER_CACHE_PATH", str(cache_path)):
+            servers = Server.from_directory(directory_with_configs)
+
+        # Assert
+        assert len(servers) == 3
+
     def test_from_directory_error_loading_data(
         self,
         server_configuration_json: dict[str, Any],
@@ -339,3 +551,43 @@ class TestServer:
 
         # Assert
         assert embed_fields == [EmbedField(name="Today's schedule is empty!", value="")]
+
+    def test_get_full_schedule_embed_fields_caches_event_times(
+        self, example_server: Server
+    ) -> None:
+        # Arrange
+        event_count = 1000
+        start = datetime(2024, 10, 7, tzinfo=timezone.utc)
+
+        example_server.timezones = [
+            Timezone(name=name, text=name)
+            for name in ["UTC", "CET", "Asia/Dubai", "America/New_York", "Asia/Tokyo"]
+        ]
+        example_server.schedule = [
+            ScheduleEvent(
+                title=f"Event {i}",
+                start=start + timedelta(hours=i),
+                end=start + timedelta(hours=i, minutes=30),
+            )
+            for i in range(event_count)
+        ]
+        example_server.deadlines = []
+
+        # Act
+        with patch.object(
+            ScheduleEvent,
+            "_get_event_time_text",
+            autospec=True,
+            side_effect=ScheduleEvent._get_event_time_text,
+        ) as mock_get_event_time_text:
+            first_fields = list(example_server.get_full_schedule_embed_fields())
+            first_call_count = mock_get_event_time_text.call_count
+
+            second_fields = list(example_server.get_full_schedule_embed_fields())
+            second_call_count = mock_get_event_time_text.call_count - first_call_count
+
+        # Assert
+        assert first_fields == second_fields
+        assert first_call_count - second_call_count == event_count * len(
+            example_server.timezones
+        )
@@ -0,0 +1,124 @@
+import logging
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from server.server_cache import ServerCache
+
+
+class TestServerCache:
+    EXAMPLE_CONTENT = b'{"name": "Some server"}'
+
+    @pytest.fixture
+    def cache_path(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yield Path(tmp_dir) / "cache" / "servers.pickle"
+
+    def test_get_key(self) -> None:
+        # Act
+        key = ServerCache.get_key(self.EXAMPLE_CONTENT)
+
+        # Assert
+        assert key == ServerCache.get_key(self.EXAMPLE_CONTENT)
+        assert key != ServerCache.get_key(b"{}")
+
+    def test_get_missing_file(self, cache_path: Path) -> None:
+        # Arrange
+        server_cache = ServerCache(cache_path)
+
+        # Act
+        value = server_cache.get("some key")
+
+        # Assert
+        assert value is None
+
+    def test_save(self, cache_path: Path) -> None:
+        # Arrange
+        server_cache = ServerCache(cache_path)
+        server_cache.set("some key", "some value")
+
+        # Act
+        server_cache.save()
+
+        # Assert
+        assert ServerCache(cache_path).get("some key") == "some value"
+
+    def test_save_unwritable_directory(
+        self, cache_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # Arrange
+        cache_path.parent.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.parent.write_bytes(b"Some file")
+        server_cache = ServerCache(cache_path)
+        server_cache.set("some key", "some value")
+
+        # Act
+        with caplog.at_level(logging.WARNING, "server.server_cache"):
+            server_cache.save()
+
+        # Assert
+        assert f"Unable to save server cache {cache_path}" in caplog.text
+
+    def test_save_replace_error(
+        self, cache_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # Arrange
+        cache_path.mkdir(parents=True)
+        server_cache = ServerCache(cache_path)
+        server_cache.set("some key", "some value")
+
+        # Act
+        with caplog.at_level(logging.WARNING, "server.server_cache"):
+            server_cache.save()
+
+        # Assert
+        assert f"Unable to save server cache {cache_path}" in caplog.text
+        assert list(cache_path.parent.iterdir()) == [cache_path]
+
+    def test_save_removes_unused_entries(self, cache_path: Path) -> None:
+        # Arrange
+        server_cache = ServerCache(cache_path)
+        server_cache.set("used key", "used value")
+        server_cache.set("unused key", "unused value")
+        server_cache.save()
+
+        server_cache = ServerCache(cache_path)
+        server_cache.get("used key")
+
+        # Act
+        server_cache.save()
+
+        # Assert
+        server_cache = ServerCache(cache_path)
+        assert server_cache.get("used key") == "used value"
+        assert server_cache.get("unused key") is None
+
+    def test_get_different_code_version(self, cache_path: Path) -> None:
+        # Arrange
+        cache_path.parent.mkdir(parents=True)
+        with cache_path.open("wb") as file:
+            pickle.dump(("some version", {"some key": "some value"}), file)
+
+        # Act
+        value = ServerCache(cache_path).get("some key")
+
+        # Assert
+        assert value is None
+
+    def test_get_corrupted_file(
+        self, cache_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # Arrange
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(b"Some invalid content")
+
+        # Act
+        with caplog.at_level(logging.WARNING, "server.server_cache"):
+            value = ServerCache(cache_path).get("some key")
+
+        # Assert
+        assert value is None
+        assert f"Unable to read server cache {cache_path}" in caplog.text
@@ -0,0 +1,171 @@
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, cast, Generator
+
+import pytest
+
+from server.server import Server
+from server.server_watcher import ServerWatcher
+
+
+class TestServerWatcher:
+    @pytest.fixture
+    def server_configuration_json(self) -> dict[str, Any]:
+        server_path = Path.cwd() / "tests" / "assets" / "servers" / "server.json"
+
+        return cast(dict[str, Any], json.loads(server_path.read_bytes()))
+
+    @pytest.fixture
+    def directory_with_configs(
+        self, server_configuration_json: dict[str, Any]
+    ) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir_path = Path(tmp_dir)
+
+            for i in range(3):
+                server_configuration_json["name"] = f"Server {i}"
+                server_configuration_json["server_id"] = i
+
+                with open(tmp_dir_path / f"server_{i}.json", "w+") as file:
+                    json.dump(server_configuration_json, file)
+
+            yield tmp_dir_path
+
+    @pytest.fixture
+    def example_watcher(self, directory_with_configs: Path) -> ServerWatcher:
+        watcher = ServerWatcher(directory_with_configs)
+        watcher.load()
+
+        return watcher
+
+    @staticmethod
+    def _write_config(file_path: Path, configuration_json: dict[str, Any]) -> None:
+        file_path.write_text(json.dumps(configuration_json))
+
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_load(
+        self, directory_with_configs: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # Arrange
+        watcher = ServerWatcher(directory_with_configs)
+
+        # Act
+        with caplog.at_level(logging.INFO, "server.server_watcher"):
+            servers = watcher.load()
+
+        # Assert
+        assert servers == Server.from_directory(directory_with_configs)
+        assert "Successfully loaded 3 servers" in caplog.text
+
+    def test_poll_no_changes(self, example_watcher: ServerWatcher) -> None:
+        # Act
+        updated_servers, removed_server_ids = example_watcher.poll()
+
+        # Assert
+        assert updated_servers == {}
+        assert removed_server_ids == set()
+
+    def test_poll_modified_file(
+        self,
+        example_watcher: ServerWatcher,
+        directory_with_configs: Path,
+        server_configuration_json: dict[str, Any],
+    ) -> None:
+        # Arrange
+        server_configuration_json["name"] = "Modified server"
+        server_configuration_json["server_id"] = 1
+
+        self._write_config(
+            directory_with_configs / "server_1.json", server_configuration_json
+        )
+
+        # Act
+        updated_servers, removed_server_ids = example_watcher.poll()
+
+        # Assert
+        assert list(updated_servers) == [1]
+        assert updated_servers[1].name == "Modified server"
+        assert removed_server_ids == set()
+
+        assert example_watcher.poll() == ({}, set())
+
+    def test_poll_new_file(
+        self,
+        example_watcher: ServerWatcher,
+        directory_with_configs: Path,
+        server_configuration_json: dict[str, Any],
+    ) -> None:
+        # Arrange
+        server_configuration_json["server_id"] = 3
+
+        self._write_config(
+            directory_with_configs / "server_3.json", server_configuration_json
+        )
+
+        # Act
+        updated_servers, removed_server_ids = example_watcher.poll()
+
+        # Assert
+        assert list(updated_servers) == [3]
+        assert removed_server_ids == set()
+
+    def test_poll_removed_file(
+        self, example_watcher: ServerWatcher, directory_with_configs: Path
+    ) -> None:
+        # Arrange
+        (directory_with_configs / "server_2.json").unlink()
+
+        # Act
+        updated_servers, removed_server_ids = example_watcher.poll()
+
+        # Assert
+        assert updated_servers == {}
+        assert removed_server_ids == {2}
+
+    def test_poll_changed_server_id(
+        self,
+        example_watcher: ServerWatcher,
+        directory_with_configs: Path,
+        server_configuration_json: dict[str, Any],
+    ) -> None:
+        # Arrange
+        server_configuration_json["server_id"] = 4
+
+        self._write_config(
+            directory_with_configs / "server_0.json", server_configuration_json
+        )
+
+        # Act
+        updated_servers, removed_server_ids = example_watcher.poll()
+
+        # Assert
+        assert list(updated_servers) == [4]
+        assert removed_server_ids == {0}
+
+    def test_poll_invalid_file(
+        self,
+        example_watcher: ServerWatcher,
+        directory_with_configs: Path,
+        server_configuration_json: dict[str, Any],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        # Arrange
+        server_configuration_json["name"] = 1234
+
+        self._write_config(
+            directory_with_configs / "server_0.json", server_configuration_json
+        )
+
+        # Act
+        with caplog.at_level(logging.ERROR, "server.server_watcher"):
+            updated_servers, removed_server_ids = example_watcher.poll()
+
+        # Assert
+        assert updated_servers == {}
+        assert removed_server_ids == set()
+        assert "Unable to reload server data from server_0.json" in caplog.text
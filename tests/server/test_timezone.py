@@ -1,8 +1,15 @@
+import os
+import subprocess
+import sys
+import timeit
+from typing import Callable
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from server.timezone import Timezone
+from server.zone_info_registry import ZoneInfoRegistry
 
 
 class TestTimezone:
@@ -31,6 +38,50 @@ class TestTimezone:
         with pytest.raises(ValueError, match="'Some name' isn't a valid timezone"):
             Timezone.model_validate(timezone_json)
 
+    @pytest.mark.parametrize("name", ["America", "../UTC", "", 12345])
+    def test_model_validate_invalid_name_value(
+        self, timezone_json: dict[str, str], name: str
+    ) -> None:
+        # Arrange
+        timezone_json["name"] = name
+
+        # Act
+        with pytest.raises(ValueError, match="isn't a valid timezone"):
+            Timezone.model_validate(timezone_json)
+
+    def test_import_time(self, record_property: Callable[[str, object], None]) -> None:
+        # Arrange
+        script = (
+            "import zoneinfo\n"
+            "def available_timezones():\n"
+            "    raise AssertionError('Timezone database scanned during import')\n"
+            "zoneinfo.available_timezones = available_timezones\n"
+            "import server"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        # Assert
+        assert result.returncode == 0, result.stderr
+
+        import_times = {
+            module.strip(): int(self_time)
+            for self_time, _, module in (
+                line.removeprefix("import time:").split("|")
+                for line in result.stderr.splitlines()
+                if line.startswith("import time:") and "self [us]" not in line
+            )
+        }
+        record_property(
+            "server.timezone import time [us]", import_times["server.timezone"]
+        )
+
     def test_zone_info(self, example_timezone: Timezone) -> None:
         # Arrange
         expected_zone_info = ZoneInfo("CET")
@@ -41,6 +92,35 @@ class TestTimezone:
         # Assert
         assert zone_info is expected_zone_info  # Instances should be cached internally
 
+    def test_zone_info_shared(self, example_timezone: Timezone) -> None:
+        # Arrange
+        other_timezone = Timezone(name="CET", text="Warsaw, Poland")
+
+        # Act
+        with patch.object(
+            ZoneInfoRegistry, "get", wraps=ZoneInfoRegistry.get
+        ) as mock_get:
+            zone_infos = [example_timezone.zone_info for _ in range(3)]
+
+        # Assert
+        assert all(item is other_timezone.zone_info for item in zone_infos)
+        mock_get.assert_called_once_with("CET")
+
+    def test_zone_info_read_time(
+        self, example_timezone: Timezone, record_property: Callable[[str, object], None]
+    ) -> None:
+        # Arrange
+        repeat_count = 100_000
+        example_timezone.zone_info
+
+        # Act
+        elapsed = timeit.timeit(lambda: example_timezone.zone_info, number=repeat_count)
+
+        # Assert
+        record_property(
+            "Timezone.zone_info read time [us]", elapsed / repeat_count * 1_000_000
+        )
+
     def test_eq(self, example_timezone: Timezone) -> None:
         # Arrange
         timezone = example_timezone.model_copy()
@@ -0,0 +1,13 @@
+from zoneinfo import ZoneInfo
+
+from server.zone_info_registry import ZoneInfoRegistry
+
+
+class TestZoneInfoRegistry:
+    def test_get(self) -> None:
+        # Act
+        zone_info = ZoneInfoRegistry.get("Asia/Tokyo")
+
+        # Assert
+        assert zone_info == ZoneInfo("Asia/Tokyo")
+        assert ZoneInfoRegistry.get("Asia/Tokyo") is zone_info
@@ -0,0 +1,28 @@
+import os
+from unittest.mock import MagicMock, patch
+
+from discord import Intents
+
+from combined import CombinedClient
+from run_combined import main
+
+EXAMPLE_TOKEN = "Some token"
+
+
+@patch("combined.CombinedClient.__new__")
+@patch.dict(os.environ, {"BOT_TOKEN": EXAMPLE_TOKEN}, clear=True)
+def test_main(combined_client_new_mock: MagicMock, mock_client: MagicMock) -> None:
+    # Arrange
+    combined_client_new_mock.return_value = mock_client
+
+    expected_intents = Intents().default()
+    expected_intents.message_content = True
+
+    # Act
+    main()
+
+    # Assert
+    combined_client_new_mock.assert_called_once_with(
+        CombinedClient, intents=expected_intents
+    )
+    mock_client.run.assert_called_once_with(EXAMPLE_TOKEN)
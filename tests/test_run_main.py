@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 
 from discord import Intents
 
-from client import Client
+from client import Client, ShardedClient
 from run_bot import main
 
 EXAMPLE_TOKEN = "Some token"
@@ -24,3 +24,26 @@ def test_main(client_new_mock: MagicMock, mock_client: MagicMock) -> None:
     # Assert
     client_new_mock.assert_called_once_with(Client, intents=expected_intents)
     mock_client.run.assert_called_once_with(EXAMPLE_TOKEN)
+
+
+@patch("client.ShardedClient.__new__")
+@patch.dict(os.environ, {"BOT_TOKEN": EXAMPLE_TOKEN}, clear=True)
+@patch.object(Client, "SHARD_COUNT", "4")
+@patch.object(Client, "SHARD_IDS", "0,1")
+def test_main_sharded(
+    sharded_client_new_mock: MagicMock, mock_client: MagicMock
+) -> None:
+    # Arrange
+    sharded_client_new_mock.return_value = mock_client
+
+    expected_intents = Intents().default()
+    expected_intents.message_content = True
+
+    # Act
+    main()
+
+    # Assert
+    sharded_client_new_mock.assert_called_once_with(
+        ShardedClient, intents=expected_intents, shard_count=4, shard_ids=[0, 1]
+    )
+    mock_client.run.assert_called_once_with(EXAMPLE_TOKEN)